@@ -8,5 +8,5 @@ Blue Pulse — Fast Audio & Bluetooth Controller (modularized)
 This program comes with ABSOLUTELY NO WARRANTY.
 GPL v2 — JJ Posti <techtimejourney.net>
 """
-__all__ = ["app", "controller", "audio_pactl", "qt_compat", "workers", "agent"]
+__all__ = ["app", "controller", "audio_pactl", "qt_compat", "workers", "agent", "bluez"]
 __version__ = "1.0.0"
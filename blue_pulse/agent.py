@@ -13,8 +13,9 @@ class Agent(dbus.service.Object):
     @dbus.service.method('org.bluez.Agent1', in_signature='', out_signature='')
     def Release(self): pass
 
-    @dbus.service.method('org.bluez.Agent1', in_signature='os', out_signature='')
-    def AuthorizeService(self, device, uuid): pass
+    # Pairing hot path: reply straight away through the async callback
+    @dbus.service.method('org.bluez.Agent1', in_signature='os', out_signature='', async_callbacks=('ok', 'err'))
+    def AuthorizeService(self, device, uuid, ok, err): ok()
 
     @dbus.service.method('org.bluez.Agent1', in_signature='o', out_signature='s')
     def RequestPinCode(self, device): return "0000"
@@ -25,11 +26,11 @@ class Agent(dbus.service.Object):
     @dbus.service.method('org.bluez.Agent1', in_signature='os', out_signature='')
     def DisplayPinCode(self, device, pincode): pass
 
-    @dbus.service.method('org.bluez.Agent1', in_signature='ou', out_signature='')
-    def RequestConfirmation(self, device, passkey): return
+    @dbus.service.method('org.bluez.Agent1', in_signature='ou', out_signature='', async_callbacks=('ok', 'err'))
+    def RequestConfirmation(self, device, passkey, ok, err): ok()
 
-    @dbus.service.method('org.bluez.Agent1', in_signature='o', out_signature='')
-    def RequestAuthorization(self, device): return
+    @dbus.service.method('org.bluez.Agent1', in_signature='o', out_signature='', async_callbacks=('ok', 'err'))
+    def RequestAuthorization(self, device, ok, err): ok()
 
     @dbus.service.method('org.bluez.Agent1', in_signature='', out_signature='')
     def Cancel(self): pass
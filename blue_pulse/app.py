@@ -16,7 +16,7 @@ import sys
 import threading
 import logging
 sys.dont_write_bytecode = True
-from .qt_compat import QtWidgets, USING_QT6
+from .qt_compat import QtWidgets, QTimer, USING_QT6
 from .controller import VolumeController
 
 import dbus
@@ -24,6 +24,8 @@ from dbus.mainloop.glib import DBusGMainLoop
 from gi.repository import GLib
 
 from .agent import Agent
+from .bluez import system_bus, bluez_interface, dbus_error_name
+from .workers import stop_discovery
 
 logging.disable(logging.CRITICAL)
 
@@ -39,33 +41,50 @@ def main():
     g_thread = threading.Thread(target=g_loop.run, daemon=True)
     g_thread.start()
 
-    # Register BlueZ Agent
-    bus = dbus.SystemBus()
-    agent_path = "/blue/pulse/agent"
-    agent = Agent(bus, agent_path)
-    am = dbus.Interface(bus.get_object("org.bluez", "/org/bluez"), "org.bluez.AgentManager1")
-    try:
-        am.RegisterAgent(agent_path, "NoInputNoOutput")
-    except dbus.DBusException as e:
-        if getattr(e, "get_dbus_name", lambda: "")() != 'org.bluez.Error.AlreadyExists':
-            raise
-    try:
-        am.RequestDefaultAgent(agent_path)
-    except dbus.DBusException as e:
-        if getattr(e, "get_dbus_name", lambda: "")() != 'org.bluez.Error.AlreadyExists':
-            raise
-
-    # Show main controller
+    # Show main controller first; the agent round-trips wait for the first paint
     w = VolumeController()
     w.show()
+    app.processEvents()
+
+    agent_path = dbus.ObjectPath("/blue/pulse/agent")   # typed: the proxy does not introspect
+    registered = {}
+
+    def _already_exists(e):
+        return dbus_error_name(e) == 'org.bluez.Error.AlreadyExists'
+
+    def register_agent():
+        # Register BlueZ Agent. Async: replies land on the GLib thread, the UI never waits
+        registered['agent'] = Agent(system_bus(), agent_path)
+        am = registered['am'] = bluez_interface("/org/bluez", "org.bluez.AgentManager1")
+
+        def on_default_error(e):
+            if not _already_exists(e):
+                logging.error(f"RequestDefaultAgent failed: {e}")
+
+        def request_default():
+            am.RequestDefaultAgent(agent_path, reply_handler=lambda: None, error_handler=on_default_error)
+
+        def on_register_error(e):
+            if _already_exists(e):
+                request_default()
+            else:
+                logging.error(f"RegisterAgent failed: {e}")
+
+        am.RegisterAgent(agent_path, "NoInputNoOutput",
+                         reply_handler=request_default, error_handler=on_register_error)
+
+    QTimer.singleShot(0, register_agent)
 
     # Enter Qt loop
     ret = app.exec() if USING_QT6 else app.exec_()
 
     # Cleanup
-    try:
-        am.UnregisterAgent(agent_path)
-    except dbus.DBusException:
-        pass
+    stop_discovery()   # a scan still in its window when the window closed
+    am = registered.get('am')
+    if am is not None:
+        try:
+            am.UnregisterAgent(agent_path)
+        except dbus.DBusException:
+            pass
     g_loop.quit()
     sys.exit(ret)
@@ -1,12 +1,38 @@
 # -*- coding: utf-8 -*-
 import re, sys
+import json
+import time
+import threading
 import logging
-from .qt_compat import QProcess
+from .qt_compat import QtCore, QProcess
 sys.dont_write_bytecode = True
+
+try:
+    import pulsectl   # optional: in-process volume/mute instead of forking pactl
+except ImportError:
+    pulsectl = None
 logging.disable(logging.CRITICAL)
 # logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# 'pactl list sinks|sources' block fields (one search per field per block)
+_BLOCK_SPLIT_RE = {
+    "sink":   re.compile(r"^\s*Sink #", re.M),
+    "source": re.compile(r"^\s*Source #", re.M),
+}
+_NAME_RE = re.compile(r"^\s*Name:[ \t]*(.+)$", re.M)
+_DESC_RE = re.compile(r"^\s*Description:[ \t]*(.*)$", re.M)
+_VOL_RE  = re.compile(r"^\s*Volume:[^\n]*?(\d+)%", re.M)
+_MUTE_RE = re.compile(r"^\s*Mute:[ \t]*(\S+)", re.M)
+# 'pactl info': "Default Sink: <name>" / "Default Source: <name>"
+_INFO_DEFAULT_RE = re.compile(r"^Default (Sink|Source):(.*)$", re.M)
+# 'pactl list cards': the Name: field of each Card # block
+_CARD_NAME_RE = re.compile(r"^\s*Card #\d+[^\n]*\n(?:(?!\s*Card #)[^\n]*\n)*?\s*Name:[ \t]*(\S+)", re.M)
+
 # -------- pactl helpers (fast) --------
+# For output read by pattern (subscribe events): pactl translates its messages
+PACTL_QENV = QtCore.QProcessEnvironment.systemEnvironment()
+PACTL_QENV.insert("LC_ALL", "C")
+
 def run_pactl_command(args):
     """Run a pactl command using QProcess and return its output (UTF-8)."""
     process = QProcess()
@@ -16,11 +42,114 @@ def run_pactl_command(args):
     logging.error("pactl command timed out: " + " ".join(args))
     return ""
 
-def _parse_default_from_info(info_txt: str, label: str) -> str:
-    for line in info_txt.splitlines():
-        if line.startswith(label + ":"):
-            return line.split(":", 1)[1].strip()
-    return ""
+def run_pactl_commands(arg_lists, timeout_ms=3000):
+    """Start several pactl commands at once, then collect their outputs (in order)."""
+    procs = []
+    for args in arg_lists:
+        process = QProcess()
+        process.start("pactl", args)
+        procs.append((process, args))
+    out = []
+    for process, args in procs:
+        if process.waitForFinished(timeout_ms):
+            out.append(bytes(process.readAllStandardOutput()).decode("utf-8", "replace"))
+        else:
+            logging.error("pactl command timed out: " + " ".join(args))
+            out.append("")
+    return out
+
+try:
+    _FAILED_TO_START = QProcess.ProcessError.FailedToStart  # PyQt6
+except AttributeError:
+    _FAILED_TO_START = QProcess.FailedToStart               # PyQt5
+
+# Fire-and-forget writers (GUI thread only: the QProcess needs its event loop)
+_async_running = {}   # key -> QProcess still running (also keeps it alive)
+_async_queued = {}    # key -> latest args waiting behind it
+
+def run_pactl_async(key, args):
+    """
+    Start pactl without waiting for it. Calls sharing a key run one at a time
+    and only the newest queued one survives, so a slider drag can't land
+    out of order or pile up processes.
+    """
+    if key in _async_running:
+        _async_queued[key] = args
+        return
+    process = QProcess()
+    _async_running[key] = process
+    process.finished.connect(lambda *_: _pactl_async_done(key, process))
+    process.errorOccurred.connect(
+        lambda err: err == _FAILED_TO_START and _pactl_async_done(key, process))
+    process.start("pactl", args)
+
+def _pactl_async_done(key, process):
+    if _async_running.get(key) is not process:
+        return
+    del _async_running[key]
+    process.deleteLater()
+    invalidate_audio_snapshot()
+    args = _async_queued.pop(key, None)
+    if args is not None:
+        run_pactl_async(key, args)
+
+# None = not known yet; True/False once pactl has actually answered (see below)
+_PACTL_JSON = None
+_PACTL_VERSION_RE = re.compile(r"pactl (\d+)")
+
+def loads_pactl_json(text: str):
+    """
+    Decode 'pactl -f json' output. Only output that is there decides the
+    capability: an empty reply (timeout, server still starting) leaves it
+    unknown so the next call tries JSON again.
+    """
+    global _PACTL_JSON
+    if not text.strip():
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if _PACTL_JSON is None:
+        _PACTL_JSON = data is not None
+    return data
+
+def pactl_has_json():
+    """True/False once pactl has answered (JSON output or --version), None before."""
+    return _PACTL_JSON
+
+def note_pactl_version(text: str):
+    """Settle JSON support (pactl 16+) from 'pactl --version' output, if it has a version."""
+    global _PACTL_JSON
+    m = _PACTL_VERSION_RE.match(text)
+    if m:
+        _PACTL_JSON = int(m.group(1)) >= 16
+
+def _probe_pactl_version():
+    # JSON call printed nothing: old pactl rejects '-f' on stderr only, so ask its version
+    note_pactl_version(run_pactl_command(['--version']))
+
+def run_pactl_json(args):
+    """
+    Run 'pactl -f json <args>' and return the decoded document.
+    Returns None when this pactl has no JSON output (older PulseAudio);
+    the capability is remembered for the session once pactl has answered.
+    """
+    if _PACTL_JSON is False:
+        return None
+    data = loads_pactl_json(run_pactl_command(['-f', 'json'] + list(args)))
+    if data is None and _PACTL_JSON is None:
+        _probe_pactl_version()
+    return data
+
+def _parse_defaults_from_info(info_txt: str) -> dict:
+    """Both defaults from 'pactl info' in one scan."""
+    defaults = {"sink": "", "source": ""}
+    for kind, value in _INFO_DEFAULT_RE.findall(info_txt):
+        key = kind.lower()
+        if not defaults[key]:   # first occurrence wins, as before
+            defaults[key] = value.strip()
+    return defaults
 
 def _parse_devices_with_state(text: str, kind: str):
     """
@@ -29,43 +158,85 @@ def _parse_devices_with_state(text: str, kind: str):
     """
     items = []
     state_map = {}
-    current = {}
-    cur_vol = None
-    cur_mute = None
-
-    header = f"{kind.capitalize()} #"
-
-    def _commit():
-        nonlocal current, cur_vol, cur_mute
-        if current.get("name"):
-            items.append(current)
-            state_map[current["name"]] = {
-                "volume": int(cur_vol) if cur_vol is not None else 0,
-                "mute": bool(cur_mute) if cur_mute is not None else False,
-            }
-        current = {}
-        cur_vol = None
-        cur_mute = None
-
-    for raw in text.splitlines():
-        line = raw.strip()
-        if line.startswith(header):
-            _commit()
-        elif line.startswith("Name:"):
-            current["name"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Description:"):
-            current["description"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Volume:"):
-            m = re.search(r"(\d+)%", line)
-            if m:
-                cur_vol = int(m.group(1))
-        elif line.startswith("Mute:"):
-            cur_mute = (line.split(":", 1)[1].strip().lower() == "yes")
-
-    _commit()
+    for block in _BLOCK_SPLIT_RE[kind].split(text)[1:]:
+        m = _NAME_RE.search(block)
+        if not m:
+            continue
+        name = m.group(1).strip()
+        item = {"name": name}
+        m = _DESC_RE.search(block)
+        if m:
+            item["description"] = m.group(1).strip()
+        m = _VOL_RE.search(block)
+        mute = _MUTE_RE.search(block)
+        items.append(item)
+        state_map[name] = {
+            "volume": int(m.group(1)) if m else 0,
+            "mute": bool(mute) and mute.group(1).lower() == "yes",
+        }
     return items, state_map
 
-def get_audio_snapshot():
+def _json_volume_pct(volume) -> int:
+    # first channel, same as the text parser ("front-left: 65536 / 100% / ...")
+    for ch in (volume or {}).values():
+        try:
+            return int(str(ch.get("value_percent", "0")).strip().rstrip("%"))
+        except (AttributeError, ValueError):
+            return 0
+    return 0
+
+def _parse_devices_from_json(entries):
+    """Same (items, state_map) shape as _parse_devices_with_state, from 'pactl -f json list'."""
+    items = []
+    state_map = {}
+    for e in entries or []:
+        name = e.get("name")
+        if not name:
+            continue
+        items.append({"name": name, "description": e.get("description") or name})
+        state_map[name] = {
+            "volume": _json_volume_pct(e.get("volume")),
+            "mute": bool(e.get("mute", False)),
+        }
+    return items, state_map
+
+def _get_audio_snapshot_json():
+    """Two forks ('info' + one full 'list') instead of three; None if JSON is unavailable."""
+    global _PACTL_JSON
+    if _PACTL_JSON is False:
+        return None
+    info_txt, lists_txt = run_pactl_commands([['-f', 'json', 'info'], ['-f', 'json', 'list']])
+    info = loads_pactl_json(info_txt)
+    if info is None and _PACTL_JSON is None:
+        _probe_pactl_version()
+    if not isinstance(info, dict):
+        return None
+    if not lists_txt.strip():
+        return None   # no answer this time (timeout); the text path answers instead
+    lists = loads_pactl_json(lists_txt)
+    if not isinstance(lists, dict) or "sinks" not in lists or "sources" not in lists:
+        # 'list' that doesn't decode, or has no sections: stay on the text parser from now on
+        _PACTL_JSON = False
+        return None
+    defaults = {
+        "sink":   info.get("default_sink_name") or "",
+        "source": info.get("default_source_name") or "",
+    }
+    sinks, sink_map  = _parse_devices_from_json(lists["sinks"])
+    sources, src_map = _parse_devices_from_json(lists["sources"])
+    return defaults, sinks, sink_map, sources, src_map
+
+def _get_audio_snapshot_text():
+    info_txt, sinks_txt, srcs_txt = run_pactl_commands(
+        [['info'], ['list', 'sinks'], ['list', 'sources']]
+    )
+
+    defaults = _parse_defaults_from_info(info_txt)
+    sinks, sink_map   = _parse_devices_with_state(sinks_txt,  kind="sink")
+    sources, src_map  = _parse_devices_with_state(srcs_txt,   kind="source")
+    return defaults, sinks, sink_map, sources, src_map
+
+def _get_audio_snapshot_uncached():
     """
     Return a single snapshot:
     {
@@ -76,16 +247,10 @@ def get_audio_snapshot():
       'source_map': {name: {'volume': int, 'mute': bool}},
     }
     """
-    info_txt  = run_pactl_command(['info'])
-    sinks_txt = run_pactl_command(['list', 'sinks'])
-    srcs_txt  = run_pactl_command(['list', 'sources'])
-
-    defaults = {
-        "sink":   _parse_default_from_info(info_txt, "Default Sink"),
-        "source": _parse_default_from_info(info_txt, "Default Source"),
-    }
-    sinks, sink_map   = _parse_devices_with_state(sinks_txt,  kind="sink")
-    sources, src_map  = _parse_devices_with_state(srcs_txt,   kind="source")
+    parsed = _get_audio_snapshot_json()
+    if parsed is None:
+        parsed = _get_audio_snapshot_text()
+    defaults, sinks, sink_map, sources, src_map = parsed
 
     # PipeWire sometimes says "pipewire" as default
     if defaults["sink"].lower() == "pipewire" and sinks:
@@ -101,31 +266,142 @@ def get_audio_snapshot():
         "source_map": src_map,
     }
 
+# -------- snapshot cache --------
+# Several callers ask for a snapshot within one user action (pairing, sink switch);
+# a short TTL lets them share one set of pactl calls. set-* commands invalidate it.
+SNAPSHOT_TTL = 0.3  # seconds
+_snapshot_lock = threading.Lock()
+_snapshot_cache = None   # (monotonic timestamp, snapshot)
+_snapshot_gen = 0        # bumped on invalidation so an in-flight fetch isn't cached stale
+
+def invalidate_audio_snapshot():
+    global _snapshot_cache, _snapshot_gen
+    with _snapshot_lock:
+        _snapshot_cache = None
+        _snapshot_gen += 1
+
+def get_audio_snapshot():
+    """Cached front of _get_audio_snapshot_uncached (see SNAPSHOT_TTL)."""
+    global _snapshot_cache
+    with _snapshot_lock:
+        cached, gen = _snapshot_cache, _snapshot_gen
+    if cached and time.monotonic() - cached[0] < SNAPSHOT_TTL:
+        return cached[1]
+    snap = _get_audio_snapshot_uncached()
+    with _snapshot_lock:
+        if gen == _snapshot_gen:
+            _snapshot_cache = (time.monotonic(), snap)
+    return snap
+
+# -------- libpulse (pulsectl) fast path --------
+_pulse = None
+_pulse_unavailable = False
+_pulse_objs = {}   # ('sink' | 'source', name) -> pulsectl object
+
+def _get_pulse():
+    global _pulse, _pulse_unavailable
+    if pulsectl is None or _pulse_unavailable:
+        return None
+    if _pulse is None:
+        try:
+            _pulse = pulsectl.Pulse('blue-pulse', threading_lock=True)
+        except Exception as e:
+            logging.error(f"pulsectl connect failed, using pactl: {e}")
+            _pulse_unavailable = True
+            return None
+    return _pulse
+
+def forget_pulse_objects():
+    """Drop cached sink/source objects (call when devices are added/removed)."""
+    _pulse_objs.clear()
+
+def close_pulse():
+    global _pulse
+    forget_pulse_objects()
+    if _pulse is not None:
+        _pulse.close()
+        _pulse = None
+
+def _pulse_call(kind, name, fn):
+    """Run fn(pulse, obj) on sink/source `name`. Returns False if the caller should use pactl."""
+    global _pulse
+    pulse = _get_pulse()
+    if pulse is None:
+        return False
+    try:
+        obj = _pulse_objs.get((kind, name))
+        if obj is None:
+            obj = pulse.get_sink_by_name(name) if kind == 'sink' else pulse.get_source_by_name(name)
+            _pulse_objs[(kind, name)] = obj
+        fn(pulse, obj)
+        return True
+    except Exception as e:
+        logging.error(f"pulsectl {kind} call failed for {name}: {e}")
+        forget_pulse_objects()
+        if isinstance(e, pulsectl.PulseDisconnected):
+            _pulse = None
+        return False
+
+def _set_volume(kind, name, v):
+    if not _pulse_call(kind, name, lambda pulse, obj: pulse.volume_set_all_chans(obj, v / 100.0)):
+        run_pactl_async((kind, name, 'volume'), [f'set-{kind}-volume', name, f"{v}%"])
+    invalidate_audio_snapshot()
+
+def _set_mute(kind, name, m):
+    if not _pulse_call(kind, name, lambda pulse, obj: pulse.mute(obj, bool(m))):
+        run_pactl_async((kind, name, 'mute'), [f'set-{kind}-mute', name, '1' if m else '0'])
+    invalidate_audio_snapshot()
+
+def _run_and_invalidate(args):
+    run_pactl_command(args)
+    invalidate_audio_snapshot()
+
 # Thin wrappers kept for direct control actions
-def set_default_sink_cmd(sink_name):   run_pactl_command(['set-default-sink',   sink_name])
-def set_default_source_cmd(src_name):  run_pactl_command(['set-default-source', src_name])
-def set_sink_volume_cmd(sink_name, v): run_pactl_command(['set-sink-volume',    sink_name, f"{v}%"])
-def set_source_volume_cmd(src_name, v):run_pactl_command(['set-source-volume',  src_name, f"{v}%"])
-def get_sink_mute_cmd(sink_name):      return 'yes' in run_pactl_command(['get-sink-mute', sink_name]).lower()
-def get_source_mute_cmd(src_name):     return 'yes' in run_pactl_command(['get-source-mute', src_name]).lower()
-def set_sink_mute_cmd(sink_name, m):   run_pactl_command(['set-sink-mute',      sink_name, '1' if m else '0'])
-def set_source_mute_cmd(src_name, m):  run_pactl_command(['set-source-mute',    src_name, '1' if m else '0'])
+def set_default_sink_cmd(sink_name):   _run_and_invalidate(['set-default-sink',   sink_name])
+def set_default_source_cmd(src_name):  _run_and_invalidate(['set-default-source', src_name])
+def set_sink_volume_cmd(sink_name, v): _set_volume('sink',   sink_name, v)
+def set_source_volume_cmd(src_name, v):_set_volume('source', src_name, v)
+def set_sink_mute_cmd(sink_name, m):   _set_mute('sink',   sink_name, m)
+def set_source_mute_cmd(src_name, m):  _set_mute('source', src_name, m)
 
 # Cards/profile (for Bluetooth A2DP)
 def list_cards_text():                  return run_pactl_command(['list', 'cards'])
 
+def pa_addr(address):
+    """BlueZ 'AA:BB:..' address -> the 'aa_bb_..' form used in bluez_* pulse names."""
+    return address.replace(":", "_").lower()
+
+# 'bluez_card.<aa_bb_cc_dd_ee_ff>' card names keyed by that address part;
+# None until first read, dropped again on card new/remove events
+_BLUEZ_CARD_PREFIX = 'bluez_card.'
+_bluez_cards = None
+
+def invalidate_card_cache():
+    global _bluez_cards
+    _bluez_cards = None
+
+def _read_bluez_cards():
+    cards = {}
+    n = len(_BLUEZ_CARD_PREFIX)
+    for m in _CARD_NAME_RE.finditer(list_cards_text()):
+        name = m.group(1)
+        if name.startswith(_BLUEZ_CARD_PREFIX):
+            cards.setdefault(name[n:n + 17], name)
+    return cards
+
+def read_bluez_cards():
+    """Fresh {'aa_bb_..': card name} map; blocks on pactl, so for worker threads."""
+    global _bluez_cards
+    cards = _bluez_cards = _read_bluez_cards()
+    return cards
+
 def get_card_for_device(address):
-    txt = list_cards_text()
-    expected = f'bluez_card.{address.replace(":", "_").lower()}'
-    current_card = None
-    for raw in txt.splitlines():
-        line = raw.strip()
-        if line.startswith("Card #"):
-            current_card = line.split("#")[1].rstrip(":")
-        elif line.startswith("Name:") and current_card:
-            name = line.split(":", 1)[1].strip()
-            if name.startswith(expected):
-                return name
-    return None
-
-def set_card_profile(card_name, profile): run_pactl_command(['set-card-profile', card_name, profile])
+    global _bluez_cards
+    key = pa_addr(address)
+    cards = _bluez_cards
+    if cards is None or key not in cards:
+        # A miss may be a card created since the last read (e.g. right after Connect)
+        cards = _bluez_cards = _read_bluez_cards()
+    return cards.get(key)
+
+def set_card_profile(card_name, profile): _run_and_invalidate(['set-card-profile', card_name, profile])
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Shared BlueZ object cache.
+
+Filled once from ObjectManager.GetManagedObjects() and kept current by the
+InterfacesAdded / InterfacesRemoved / PropertiesChanged handlers, so the
+controller and the pair/unpair workers look devices up in O(1) instead of
+re-fetching the whole BlueZ object tree for every action.
+Workers run on their own threads, signal handlers on the D-Bus loop thread:
+every access goes through the lock.
+
+Also home of the shared system-bus connection and BlueZ proxies, and of
+the on-disk list of paired devices used to reconnect before enumeration.
+"""
+import os
+import sys
+import json
+import threading
+import dbus
+sys.dont_write_bytecode = True
+
+__all__ = [
+    "ObjectCache", "BLUEZ_CACHE", "DEVICE_IFACE", "ADAPTER_IFACE", "PROPS_IFACE", "OM_IFACE",
+    "system_bus", "object_manager", "managed_objects", "bluez_interface",
+    "load_paired_paths", "save_paired_paths", "dbus_error_name",
+]
+
+DEVICE_IFACE = 'org.bluez.Device1'
+ADAPTER_IFACE = 'org.bluez.Adapter1'
+PROPS_IFACE = 'org.freedesktop.DBus.Properties'
+OM_IFACE = 'org.freedesktop.DBus.ObjectManager'
+
+# ---- shared connection / proxies ----
+# Created lazily: the bus must be opened after main() installs DBusGMainLoop,
+# otherwise signals and async replies have no main loop to run on.
+_bus = None
+_objects = {}   # object path -> ProxyObject, shared by all its interface views
+_proxies = {}   # (object path, interface) -> dbus.Interface
+
+def system_bus():
+    global _bus
+    if _bus is None:
+        _bus = dbus.SystemBus()
+    return _bus
+
+def bluez_interface(path, iface):
+    """Cached proxy for a BlueZ object; introspect=False since the interfaces are known.
+    Without introspection dbus-python guesses signatures from the Python types, so
+    'o' and 'v' arguments must be passed typed: dbus.ObjectPath, variant_level=1."""
+    key = (path, iface)
+    proxy = _proxies.get(key)
+    if proxy is None:
+        obj = _objects.get(path)
+        if obj is None:
+            # follow_name_owner_changes: keep working across a bluetoothd restart instead of
+            # staying bound to the old daemon's unique bus name
+            obj = _objects[path] = system_bus().get_object(
+                'org.bluez', path, introspect=False, follow_name_owner_changes=True)
+        proxy = _proxies[key] = dbus.Interface(obj, iface)
+    return proxy
+
+def object_manager():
+    return bluez_interface('/', OM_IFACE)
+
+def managed_objects():
+    """GetManagedObjects() with 'ay' values (ManufacturerData, AdvertisingData...)
+    unmarshalled as one bytes object instead of a dbus.Array of dbus.Byte.
+    (utf8_strings is Python 2 only; dbus-python on Python 3 rejects it.)"""
+    return object_manager().GetManagedObjects(byte_arrays=True)
+
+def dbus_error_name(e):
+    """'org.bluez.Error.AlreadyExists' etc. for a DBusException, "" for anything else."""
+    return e.get_dbus_name() if isinstance(e, dbus.DBusException) else ""
+
+def _drop_proxies(path):
+    _objects.pop(path, None)
+    for key in [k for k in _proxies if k[0] == path]:
+        _proxies.pop(key, None)
+
+# ---- paired devices from the last session ----
+PAIRED_CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "blue_pulse", "paired.json",
+)
+
+def load_paired_paths():
+    """{address: object path} written by save_paired_paths(); {} if missing or unreadable."""
+    try:
+        with open(PAIRED_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def save_paired_paths(paths):
+    try:
+        os.makedirs(os.path.dirname(PAIRED_CACHE_FILE), exist_ok=True)
+        with open(PAIRED_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(paths, f)
+    except OSError:
+        pass
+
+class ObjectCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded_event = threading.Event()
+        self.loaded = False
+        self.version = 0              # bumped on every change
+        self.adapters = []            # Adapter1 paths, in the order they appeared
+        self.devices = {}             # object path -> Device1 properties
+        self.address_to_path = {}
+
+    # ---- writers (startup + signal handlers) ----
+    def load(self, objects):
+        with self._lock:
+            self.devices.clear()
+            self.address_to_path.clear()
+            self.adapters.clear()
+            for path, ifaces in objects.items():
+                self._add_locked(path, ifaces)
+            self.loaded = True
+            self.version += 1
+        self._loaded_event.set()
+
+    def add(self, path, ifaces):
+        """InterfacesAdded. Returns the Device1 props if a device was added."""
+        with self._lock:
+            props = self._add_locked(path, ifaces)
+            self.version += 1
+            return props
+
+    def remove(self, path, interfaces):
+        """InterfacesRemoved. Returns True if a cached device went away."""
+        with self._lock:
+            if ADAPTER_IFACE in interfaces and path in self.adapters:
+                self.adapters.remove(path)   # a second adapter takes over, if any
+            if DEVICE_IFACE not in interfaces:
+                return False
+            props = self.devices.pop(path, None)
+            if props is None:
+                return False
+            _drop_proxies(path)
+            if self.address_to_path.get(props.get('Address')) == path:
+                del self.address_to_path[props.get('Address')]
+            self.version += 1
+            return True
+
+    def update(self, path, changed, invalidated=()):
+        """PropertiesChanged on Device1."""
+        with self._lock:
+            props = self.devices.get(path)
+            if props is None:
+                return
+            props.update(changed)
+            for key in invalidated:
+                props.pop(key, None)
+            self.version += 1
+
+    def _add_locked(self, path, ifaces):
+        if ADAPTER_IFACE in ifaces and path not in self.adapters:
+            self.adapters.append(path)
+        if DEVICE_IFACE not in ifaces:
+            return None
+        props = dict(ifaces[DEVICE_IFACE])
+        self.devices[path] = props
+        if props.get('Address'):
+            self.address_to_path[props['Address']] = path
+        return props
+
+    # ---- readers ----
+    def wait_loaded(self, timeout):
+        """Block until the first load() (e.g. from an async walk on the D-Bus thread); False on timeout."""
+        return self._loaded_event.wait(timeout)
+
+    @property
+    def adapter_path(self):
+        """First adapter still present, or None."""
+        with self._lock:
+            return self.adapters[0] if self.adapters else None
+
+    def path_for(self, address):
+        with self._lock:
+            return self.address_to_path.get(address)
+
+    def props(self, path):
+        with self._lock:
+            return dict(self.devices.get(path, {}))
+
+    def items(self):
+        """[(path, props copy), ...] safe to iterate while signals keep arriving."""
+        with self._lock:
+            return [(path, dict(p)) for path, p in self.devices.items()]
+
+    def names(self):
+        """{address: name} of every known device, paired or not."""
+        with self._lock:
+            return {
+                p.get('Address', ''): p.get('Name', p.get('Address', ''))
+                for p in self.devices.values()
+            }
+
+    def paired(self):
+        with self._lock:
+            return {
+                p.get('Address', ''): p.get('Name', p.get('Address', ''))
+                for p in self.devices.values()
+                if p.get('Paired', False)
+            }
+
+    def paired_paths(self):
+        with self._lock:
+            return {
+                p['Address']: path
+                for path, p in self.devices.items()
+                if p.get('Paired', False) and p.get('Address')
+            }
+
+BLUEZ_CACHE = ObjectCache()
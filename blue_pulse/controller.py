@@ -1,38 +1,156 @@
 # -*- coding: utf-8 -*-
 import re, sys
+import functools
 import logging
-import dbus
 sys.dont_write_bytecode = True
 from .qt_compat import (
-    QtCore, QtWidgets, QSettings, QTimer, pyqtSignal, pyqtSlot,
-    qt_align_center, qt_user_role, available_geometry
+    QtCore, QtWidgets, QSettings, QTimer, QProcess, pyqtSignal, pyqtSlot,
+    ALIGN_CENTER, USER_ROLE, available_geometry
 )
 from .ui.volume_bar import VolumeBar
 from .audio_pactl import (
-    get_audio_snapshot,
     set_default_sink_cmd, set_default_source_cmd,
     set_sink_volume_cmd,  set_source_volume_cmd,
     set_sink_mute_cmd,    set_source_mute_cmd,
-    get_card_for_device,  set_card_profile
+    set_card_profile,  invalidate_card_cache, pa_addr,
+    forget_pulse_objects, close_pulse, PACTL_QENV
+)
+from .workers import SnapshotWorker, ScanWorker, PairWorker, UnpairWorker
+from .bluez import (
+    BLUEZ_CACHE, system_bus, object_manager, bluez_interface,
+    load_paired_paths, save_paired_paths,
 )
-from .workers import ScanWorker, PairWorker, UnpairWorker
 from .defaults_profiles import ProfilesWindow    
 
 logging.disable(logging.CRITICAL)
 
+_BLUEZ_SINK_RE   = re.compile(r'bluez_sink\.([0-9a-f_]{17})')
+_BLUEZ_SOURCE_RE = re.compile(r'bluez_source\.([0-9a-f_]{17})')
+_PACTL_EVENT_RE  = re.compile(r"Event '(\w+)' on ([\w-]+) #(\d+)")
+
+# 'pactl subscribe' facilities that can change what the main window shows
+PACTL_EVENT_FACILITIES = {"sink", "source", "server", "card"}
+POLL_INTERVAL_MS = 10000             # no event stream: poll every 10s
+POLL_FAST_MS = 2000                  # ... and every 2s for a while after a change
+POLL_FAST_WINDOW_MS = 30000
+POLL_SAFETY_NET_MS = 5 * 60 * 1000   # with 'pactl subscribe' running
+CARD_WAIT_MS = 8000                  # after Connect: give up waiting for the pulse card
+
+# Device1 properties the UI cares about; RSSI/ManufacturerData/... updates are dropped
+TRACKED_DEVICE_PROPS = frozenset({'Address', 'Name', 'Alias', 'Paired', 'Trusted', 'Connected'})
+
+# Warm dark (coffee/cocoa) theme
+APP_STYLESHEET = """
+    QWidget {
+        background-color: #140E0B;        /* deep cocoa */
+        color: #F0E6DC;                    /* warm ivory text */
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 14px;
+    }
+    QLabel {
+        background: transparent;
+        color: #F0E6DC;
+    }
+    QLabel#titleLabel {
+        font-size: 20px;
+        font-weight: 700;
+        padding: 6px 0 12px 0;
+    }
+    QLabel#volumeLabel, QLabel#deviceLabel {
+        font-size: 13px;
+        padding: 6px 12px;
+        border: 1px solid #3B2A22;        /* roasted border */
+        border-radius: 8px;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                   stop:0 #1E140F, stop:1 #120C09);
+    }
+    QComboBox {
+        background: #1B120D;
+        color: #F5ECE3;
+        border: 1px solid #3B2A22;
+        border-radius: 8px;
+        padding: 6px 8px;
+    }
+    QComboBox:hover { border-color: #5A3F31; }   /* lighter roast */
+    QComboBox QAbstractItemView {
+        background: #1B120D;
+        color: #F5ECE3;
+        selection-background-color: #2A1A12;
+        selection-color: #FFFFFF;
+        border: 1px solid #3B2A22;
+    }
+    QPushButton {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                   stop:0 #2A1C15, stop:1 #1B120D);  /* espresso sheen */
+        color: #F7F0E8;
+        border: 1px solid #3B2A22;
+        border-radius: 10px;
+        padding: 8px 14px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
+                   stop:0 #342318, stop:1 #20140F);
+        border-color: #5A3F31;
+    }
+    QPushButton:pressed {
+        background: #1A120E;
+        border-color: #734E38;            /* caramel edge */
+    }
+    QListWidget {
+        background: #1A120E;
+        color: #F0E6DC;
+        border: 1px solid #3B2A22;
+        border-radius: 10px;
+        padding: 6px;
+    }
+    QListWidget::item {
+        padding: 8px;
+        border-radius: 6px;
+    }
+    QListWidget::item:selected {
+        background: #2A1A12;             /* dark walnut */
+        color: #FFFFFF;
+    }
+"""
+
+def _bluez_names_by_addr(devices, prefix):
+    n = len(prefix)
+    out = {}
+    for d in devices:
+        name = d['name']
+        if name.startswith(prefix):
+            out.setdefault(name[n:n + 17], name)   # first match wins, like the old next() scan
+    return out
+
 class VolumeController(QtWidgets.QWidget):
     devices_updated = pyqtSignal()
     bluetooth_devices_updated = pyqtSignal()
+    snapshot_requested = pyqtSignal()
+    cards_requested = pyqtSignal()
+    bt_connect_result = pyqtSignal(str, bool, str)   # address, ok, error text
+    refresh_requested = pyqtSignal(int)              # delay in ms; see schedule_refresh
+    autoconnect_result = pyqtSignal(str, bool, str)  # connect_paired_bluetooth_devices replies
+    bluez_loaded = pyqtSignal()                      # BLUEZ_CACHE filled from GetManagedObjects
+    paired_path_removed = pyqtSignal(str)            # InterfacesRemoved of a device object
 
     def __init__(self):
         super().__init__()
 
         # Persistent / runtime state
         self.settings = QSettings("MyCompany", "BluePulse")
+        self._last_bt = self.settings.value("last_bluetooth", "")
 
         # place-holders until snapshot loads
         self.sinks = []
         self.sources = []
+        self._last_snapshot = None       # last snapshot applied to the UI
+        self._sink_by_name = {}
+        self._source_by_name = {}
+        self._bluez_sink_by_addr = {}
+        self._bluez_source_by_addr = {}
+        self._sink_combo_index = {}      # sink name -> device_selector index
+        self._source_combo_index = {}    # source name -> input_selector index
         self.default_sink = ""
         self.default_source = ""
         self.is_muted = False
@@ -41,16 +159,82 @@ class VolumeController(QtWidgets.QWidget):
         # Scan state
         self.scanningActive = False
         self.scanned_devices = {}
+        self._list_items = {}            # address -> its QListWidgetItem in device_list
+        self._paired_paths = load_paired_paths()   # last session's paired devices
 
         # Timer: periodic refresh (lightweight now)
         self.poll_timer = QTimer(self)
-        self.poll_timer.setInterval(10000)  # 10s
+        self.poll_timer.setInterval(POLL_INTERVAL_MS)
         self.poll_timer.timeout.connect(self.refresh_all_devices)
+        self.poll_timer.timeout.connect(invalidate_card_cache)   # covers runs without 'pactl subscribe'
         self.poll_timer.start()
+        self._was_hidden = False
+        self._poll_fast_window = QTimer(self)   # fast-poll period after a change; back to normal on timeout
+        self._poll_fast_window.setSingleShot(True)
+        self._poll_fast_window.setInterval(POLL_FAST_WINDOW_MS)
+        self._poll_fast_window.timeout.connect(self._reset_poll_interval)
+
+        # pactl snapshots run on their own thread; results are applied on the GUI thread
+        self.snapshot_thread = QtCore.QThread(self)
+        self.snapshot_worker = SnapshotWorker()
+        self.snapshot_worker.moveToThread(self.snapshot_thread)
+        self.snapshot_requested.connect(self.snapshot_worker.run)
+        self.snapshot_worker.snapshotReady.connect(self._on_snapshot_ready)
+        self.snapshot_worker.snapshotFailed.connect(self._snapshot_failed)
+        self.cards_requested.connect(self.snapshot_worker.read_cards)
+        self.snapshot_worker.cardsReady.connect(self._on_cards_ready)
+        self.snapshot_thread.start()
+        self._snapshot_inflight = False
+        self._snapshot_again = False     # requests that arrived while one was running
+        self._snapshot_waiters = []      # callbacks for the next snapshot to start
+        self._inflight_waiters = []      # callbacks for the one running now
+        self._cards_inflight = False     # same scheme for bluez card lookups (request_cards)
+        self._card_waiters = []
+        self._inflight_card_waiters = []
+
+        # Volume writes: drags coalesce into one pactl call per quiet 40 ms
+        self._pending_sink_vol = None
+        self._sink_vol_timer = QTimer(self)
+        self._sink_vol_timer.setSingleShot(True)
+        self._sink_vol_timer.setInterval(40)
+        self._sink_vol_timer.timeout.connect(self._flush_sink_vol)
+        # (device, volume) last written or read back: snapshot-driven bar updates and
+        # repeated slider values then don't turn into pactl writes
+        self._sink_vol_known = None
+        self._source_vol_known = None
+        self._pending_source_vol = None
+        self._source_vol_timer = QTimer(self)
+        self._source_vol_timer.setSingleShot(True)
+        self._source_vol_timer.setInterval(40)
+        self._source_vol_timer.timeout.connect(self._flush_source_vol)
+
+        # pactl subscribe: event-driven audio refresh, bursts coalesced into one snapshot
+        self._pactl_sub = None
+        self._pactl_buf = b""            # subscribe output after the last complete line
+        self._pactl_live = False         # subscribe stream running: card arrivals are reported
+        self._cards_pending = set()      # connected addresses waiting for their pulse card
+        self._pactl_event_timer = QTimer(self)
+        self._pactl_event_timer.setSingleShot(True)
+        self._pactl_event_timer.setInterval(100)
+        self._pactl_event_timer.timeout.connect(self.refresh_audio_devices)
+
+        # One debounced full refresh: each request restarts the timer
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh_all_devices)
+        self.refresh_requested.connect(self._refresh_timer.start)
+        self.refresh_requested.connect(self._boost_polling)
 
         # Signals
         self.devices_updated.connect(self.refresh_audio_devices)
+        self.bt_connect_result.connect(self._on_bt_connect_result)
+        self.autoconnect_result.connect(self._on_autoconnect_result)
         self.bluetooth_devices_updated.connect(self.refresh_bluetooth_devices)
+        self.bluez_loaded.connect(self._on_bluez_loaded)
+        self.paired_path_removed.connect(self._forget_paired_path)
+        self._last_bt_tried = False      # reconnect to last_bluetooth once per run
+        self._bt_update_queued = False   # one queued list refresh at a time from D-Bus
+        self._autoconnect_pending = set()  # addresses still waiting for a Connect reply
 
         # Build UI (fast)
         self.init_ui()
@@ -60,23 +244,140 @@ class VolumeController(QtWidgets.QWidget):
 
     # -------- deferred startup --------
     def _bootstrap_after_show(self):
-        snap = get_audio_snapshot()
-        self._apply_snapshot(snap)
+        self.request_snapshot()
+        self.start_pactl_subscribe()
+        # Device list and the last-device reconnect follow once the BlueZ walk answers
         self.start_dbus_signal_listener()
-        self.populate_bluetooth_devices()
-        last_bt = self.settings.value("last_bluetooth", "")
-        if last_bt:
-            QTimer.singleShot(1500, lambda: self.connect_and_set_bluetooth_device(last_bt))
+
+    # -------- pactl subscribe --------
+    def start_pactl_subscribe(self):
+        self._pactl_buf = b""
+        self._pactl_sub = QProcess(self)
+        self._pactl_sub.setProgram("pactl")
+        self._pactl_sub.setArguments(["subscribe"])
+        self._pactl_sub.setProcessEnvironment(PACTL_QENV)   # untranslated event lines
+        self._pactl_sub.readyReadStandardOutput.connect(self._on_pactl_event)
+        self._pactl_sub.started.connect(lambda: self._set_pactl_live(True))
+        self._pactl_sub.finished.connect(lambda *_: self._set_pactl_live(False))
+        self._pactl_sub.start()
+
+    def _set_pactl_live(self, live):
+        self._pactl_live = live
+        self._poll_fast_window.stop()
+        self._reset_poll_interval()
+
+    def _reset_poll_interval(self):
+        self.poll_timer.setInterval(POLL_SAFETY_NET_MS if self._pactl_live else POLL_INTERVAL_MS)
+
+    def _boost_polling(self, *_):
+        # Only without the event stream: polling is then the only way to see the aftermath
+        if not self._pactl_live:
+            if not self._poll_fast_window.isActive():
+                self.poll_timer.setInterval(POLL_FAST_MS)
+            self._poll_fast_window.start()
+
+    def _on_pactl_event(self):
+        # Whole lines only: an event split across two reads waits for its second half
+        buf = self._pactl_buf + bytes(self._pactl_sub.readAllStandardOutput())
+        head, _, self._pactl_buf = buf.rpartition(b"\n")
+        data = head.decode("utf-8", "replace")
+        relevant = False
+        card_added = False
+        for m in _PACTL_EVENT_RE.finditer(data):
+            if m.group(2) in PACTL_EVENT_FACILITIES:
+                relevant = True
+                if m.group(1) in ("new", "remove"):
+                    forget_pulse_objects()
+                    if m.group(2) == "card":
+                        invalidate_card_cache()
+                        card_added = card_added or m.group(1) == "new"
+        if relevant:
+            self._pactl_event_timer.start()
+        if card_added and self._cards_pending:
+            self.request_cards(self._finish_pending_cards)
+
+    def _finish_pending_cards(self, cards):
+        for address in list(self._cards_pending):
+            if pa_addr(address) in cards:
+                self._cards_pending.discard(address)
+                self.set_device_as_default_sink_and_source(address, cards=cards)
+
+    def request_cards(self, then):
+        """
+        Read the bluez card names ({'aa_bb_..': card}) on the snapshot thread and
+        call then(cards) on arrival. A request made during a read waits for the next one.
+        """
+        self._card_waiters.append(then)
+        if not self._cards_inflight:
+            self._start_card_read()
+
+    def _start_card_read(self):
+        self._cards_inflight = True
+        self._inflight_card_waiters, self._card_waiters = self._card_waiters, []
+        self.cards_requested.emit()
+
+    def _on_cards_ready(self, cards):
+        waiters, self._inflight_card_waiters = self._inflight_card_waiters, []
+        self._cards_inflight = False
+        if self._card_waiters:
+            self._start_card_read()
+        for then in waiters:
+            then(cards)
+
+    def request_snapshot(self, then=None):
+        """
+        Queue an async pactl snapshot; _apply_snapshot runs when it arrives,
+        then then(snap) if given. Single-flight: requests made while one runs
+        collapse into one follow-up, and their callbacks wait for that one.
+        """
+        if then is not None:
+            self._snapshot_waiters.append(then)
+        if self._snapshot_inflight:
+            self._snapshot_again = True
+            return
+        self._snapshot_inflight = True
+        self._inflight_waiters, self._snapshot_waiters = self._snapshot_waiters, []
+        self.snapshot_requested.emit()
+
+    def _snapshot_done(self):
+        self._snapshot_inflight = False
+        if self._snapshot_again:
+            self._snapshot_again = False
+            self.request_snapshot()
+
+    def _on_snapshot_ready(self, snap: dict):
+        waiters, self._inflight_waiters = self._inflight_waiters, []
+        self._snapshot_done()
+        self._apply_snapshot(snap)
+        for then in waiters:
+            then(snap)
+
+    def _snapshot_failed(self, message):
+        self._inflight_waiters = []
+        self._snapshot_done()
+        QtWidgets.QMessageBox.warning(self, "Error", f"Failed to refresh audio devices: {message}")
 
     def _apply_snapshot(self, snap: dict):
+        # Periodic/event refreshes mostly return what is already shown
+        if snap == self._last_snapshot:
+            return
+        prev = self._last_snapshot or {"defaults": {}}
+        self._last_snapshot = snap
         self.sinks   = snap["sinks"]
         self.sources = snap["sources"]
+        self._sink_by_name   = {s['name']: s for s in self.sinks}
+        self._source_by_name = {s['name']: s for s in self.sources}
+        # 'bluez_sink.<aa_bb_..>' / 'bluez_source.<aa_bb_..>' names by their address part
+        self._bluez_sink_by_addr = _bluez_names_by_addr(self.sinks, 'bluez_sink.')
+        self._bluez_source_by_addr = _bluez_names_by_addr(self.sources, 'bluez_source.')
         self.default_sink   = snap["defaults"]["sink"]
         self.default_source = snap["defaults"]["source"]
 
-        # UI: selectors
-        self.populate_output_devices()
-        self.populate_input_devices()
+        # UI: selectors, rebuilt only when their devices or default moved (not on volume changes)
+        if self.sinks != prev.get("sinks") or self.default_sink != prev["defaults"].get("sink"):
+            self.populate_output_devices()
+        if self.sources != prev.get("sources") or self.default_source != prev["defaults"].get("source"):
+            self.populate_input_devices()
 
         # Labels
         self.output_device_label.setText(f"Output Device: {self.get_device_display_name(self.default_sink)}")
@@ -87,6 +388,8 @@ class VolumeController(QtWidgets.QWidget):
         inn = snap["source_map"].get(self.default_source, {"volume": 0, "mute": False})
         self.is_muted = out["mute"]
         self.is_input_muted = inn["mute"]
+        self._sink_vol_known = (self.default_sink, out["volume"])
+        self._source_vol_known = (self.default_source, inn["volume"])
 
         self.volume_bar.setVolume(out["volume"])
         self.label.setText(f"Output Volume: {out['volume']}%")
@@ -99,80 +402,7 @@ class VolumeController(QtWidgets.QWidget):
         self.resize(880, 520)
         self._profiles_window = None
         
-        # Warm dark (coffee/cocoa) theme
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #140E0B;        /* deep cocoa */
-                color: #F0E6DC;                    /* warm ivory text */
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 14px;
-            }
-            QLabel {
-                background: transparent;
-                color: #F0E6DC;
-            }
-            QLabel#titleLabel {
-                font-size: 20px;
-                font-weight: 700;
-                padding: 6px 0 12px 0;
-            }
-            QLabel#volumeLabel, QLabel#deviceLabel {
-                font-size: 13px;
-                padding: 6px 12px;
-                border: 1px solid #3B2A22;        /* roasted border */
-                border-radius: 8px;
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                           stop:0 #1E140F, stop:1 #120C09);
-            }
-            QComboBox {
-                background: #1B120D;
-                color: #F5ECE3;
-                border: 1px solid #3B2A22;
-                border-radius: 8px;
-                padding: 6px 8px;
-            }
-            QComboBox:hover { border-color: #5A3F31; }   /* lighter roast */
-            QComboBox QAbstractItemView {
-                background: #1B120D;
-                color: #F5ECE3;
-                selection-background-color: #2A1A12;
-                selection-color: #FFFFFF;
-                border: 1px solid #3B2A22;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                           stop:0 #2A1C15, stop:1 #1B120D);  /* espresso sheen */
-                color: #F7F0E8;
-                border: 1px solid #3B2A22;
-                border-radius: 10px;
-                padding: 8px 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                           stop:0 #342318, stop:1 #20140F);
-                border-color: #5A3F31;
-            }
-            QPushButton:pressed {
-                background: #1A120E;
-                border-color: #734E38;            /* caramel edge */
-            }
-            QListWidget {
-                background: #1A120E;
-                color: #F0E6DC;
-                border: 1px solid #3B2A22;
-                border-radius: 10px;
-                padding: 6px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 6px;
-            }
-            QListWidget::item:selected {
-                background: #2A1A12;             /* dark walnut */
-                color: #FFFFFF;
-            }
-        """)
+        self.setStyleSheet(APP_STYLESHEET)
 
         main_layout = QtWidgets.QHBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -184,18 +414,18 @@ class VolumeController(QtWidgets.QWidget):
 
         self.title_label = QtWidgets.QLabel("Volume Controller")
         self.title_label.setObjectName("titleLabel")
-        self.title_label.setAlignment(qt_align_center())
+        self.title_label.setAlignment(ALIGN_CENTER)
 
         self.output_device_label = QtWidgets.QLabel("Output Device: …")
         self.output_device_label.setObjectName("deviceLabel")
-        self.output_device_label.setAlignment(qt_align_center())
+        self.output_device_label.setAlignment(ALIGN_CENTER)
 
         self.device_selector = QtWidgets.QComboBox()
         self.device_selector.currentIndexChanged.connect(self.change_sink)
 
         self.label = QtWidgets.QLabel("Output Volume: 0%")
         self.label.setObjectName("volumeLabel")
-        self.label.setAlignment(qt_align_center())
+        self.label.setAlignment(ALIGN_CENTER)
 
         self.volume_bar = VolumeBar(self)
         self.volume_bar.setFixedHeight(64)
@@ -203,14 +433,14 @@ class VolumeController(QtWidgets.QWidget):
 
         self.input_device_label = QtWidgets.QLabel("Input Device: …")
         self.input_device_label.setObjectName("deviceLabel")
-        self.input_device_label.setAlignment(qt_align_center())
+        self.input_device_label.setAlignment(ALIGN_CENTER)
 
         self.input_selector = QtWidgets.QComboBox()
         self.input_selector.currentIndexChanged.connect(self.change_source)
 
         self.input_label = QtWidgets.QLabel("Input Volume: 0%")
         self.input_label.setObjectName("volumeLabel")
-        self.input_label.setAlignment(qt_align_center())
+        self.input_label.setAlignment(ALIGN_CENTER)
 
         self.input_volume_bar = VolumeBar(self)
         self.input_volume_bar.setFixedHeight(64)
@@ -236,7 +466,7 @@ class VolumeController(QtWidgets.QWidget):
         right_layout.setSpacing(10)
 
         self.bluetooth_label = QtWidgets.QLabel("Bluetooth Devices")
-        self.bluetooth_label.setAlignment(qt_align_center())
+        self.bluetooth_label.setAlignment(ALIGN_CENTER)
 
         self.scan_button = QtWidgets.QPushButton("Scan")
         self.pair_button = QtWidgets.QPushButton("Pair")
@@ -268,11 +498,44 @@ class VolumeController(QtWidgets.QWidget):
 
         right_layout.addStretch()
 
+        # Non-modal confirmations (success messages shouldn't block the UI)
+        self.status_bar = QtWidgets.QStatusBar()
+        self.status_bar.setSizeGripEnabled(False)
+        right_layout.addWidget(self.status_bar)
+
         main_layout.addLayout(left_layout, 1)
         main_layout.addLayout(right_layout, 1)
 
         self.center_window()
 
+    def closeEvent(self, event):
+        if self._pactl_sub is not None:
+            self._pactl_sub.finished.disconnect()
+            self._pactl_sub.kill()
+            self._pactl_sub.waitForFinished(1000)
+        self.snapshot_thread.quit()
+        self.snapshot_thread.wait()
+        if self.scanningActive:
+            self.scan_worker.cancel()
+        QtCore.QThreadPool.globalInstance().waitForDone(3000)
+        close_pulse()
+        if BLUEZ_CACHE.loaded:
+            save_paired_paths(BLUEZ_CACHE.paired_paths())
+        super().closeEvent(event)
+
+    # Nothing to show while hidden/minimized: stop polling, catch up on return
+    def hideEvent(self, event):
+        self.poll_timer.stop()
+        self._was_hidden = True
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._was_hidden:
+            self._was_hidden = False
+            self.poll_timer.start()
+            self.refresh_all_devices()
+
     def center_window(self):
         geo = available_geometry(self)
         x = geo.x() + (geo.width() - self.width()) // 2
@@ -289,145 +552,157 @@ class VolumeController(QtWidgets.QWidget):
 
     # -------- Device population --------
     def get_device_display_name(self, device_name):
-        for s in self.sinks:
-            if s.get('name') == device_name:
-                return s.get('description', device_name)
-        for s in self.sources:
-            if s.get('name') == device_name:
-                return s.get('description', device_name)
-        return device_name
+        s = self._sink_by_name.get(device_name) or self._source_by_name.get(device_name)
+        return s.get('description', device_name) if s else device_name
 
     def populate_output_devices(self):
         self.device_selector.blockSignals(True)
         self.device_selector.clear()
-        for sink in self.sinks:
-            self.device_selector.addItem(sink.get('description', sink.get('name', '')),
-                                         {'type': 'sink', 'data': sink})
-        for i in range(self.device_selector.count()):
-            data = self.device_selector.itemData(i)
-            if data and data.get('type') == 'sink' and data['data'].get('name') == self.default_sink:
-                self.device_selector.setCurrentIndex(i)
-                break
+        self._sink_combo_index = {}
+        for i, sink in enumerate(self.sinks):
+            self._sink_combo_index[sink.get('name')] = i
+            self.device_selector.addItem(sink.get('description', sink.get('name', '')), i)
+        i = self._sink_combo_index.get(self.default_sink)
+        if i is not None:
+            self.device_selector.setCurrentIndex(i)
         self.device_selector.blockSignals(False)
 
     def populate_input_devices(self):
         self.input_selector.blockSignals(True)
         self.input_selector.clear()
-        for source in self.sources:
-            self.input_selector.addItem(source.get('description', source.get('name', '')),
-                                        {'type': 'source', 'data': source})
-        for i in range(self.input_selector.count()):
-            data = self.input_selector.itemData(i)
-            if data and data.get('type') == 'source' and data['data'].get('name') == self.default_source:
-                self.input_selector.setCurrentIndex(i)
-                break
+        self._source_combo_index = {}
+        for i, source in enumerate(self.sources):
+            self._source_combo_index[source.get('name')] = i
+            self.input_selector.addItem(source.get('description', source.get('name', '')), i)
+        i = self._source_combo_index.get(self.default_source)
+        if i is not None:
+            self.input_selector.setCurrentIndex(i)
         self.input_selector.blockSignals(False)
 
     # -------- Volumes / changes --------
     def set_volume(self, value):
         self.label.setText(f'Output Volume: {value}%')
-        if self.default_sink:
-            set_sink_volume_cmd(self.default_sink, value)
-            if self.is_muted and value > 0:
-                set_sink_mute_cmd(self.default_sink, False)
-                self.is_muted = False
+        self._pending_sink_vol = value
+        self._sink_vol_timer.start()
+
+    def _flush_sink_vol(self):
+        value, self._pending_sink_vol = self._pending_sink_vol, None
+        if value is None or not self.default_sink or (self.default_sink, value) == self._sink_vol_known:
+            return
+        set_sink_volume_cmd(self.default_sink, value)
+        self._sink_vol_known = (self.default_sink, value)
+        if self.is_muted and value > 0:
+            set_sink_mute_cmd(self.default_sink, False)
+            self.is_muted = False
 
     def set_input_volume(self, value):
         self.input_label.setText(f'Input Volume: {value}%')
-        if self.default_source:
-            set_source_volume_cmd(self.default_source, value)
-            if self.is_input_muted and value > 0:
-                set_source_mute_cmd(self.default_source, False)
-                self.is_input_muted = False
+        self._pending_source_vol = value
+        self._source_vol_timer.start()
+
+    def _flush_source_vol(self):
+        value, self._pending_source_vol = self._pending_source_vol, None
+        if value is None or not self.default_source or (self.default_source, value) == self._source_vol_known:
+            return
+        set_source_volume_cmd(self.default_source, value)
+        self._source_vol_known = (self.default_source, value)
+        if self.is_input_muted and value > 0:
+            set_source_mute_cmd(self.default_source, False)
+            self.is_input_muted = False
 
     def change_sink(self, index):
-        data = self.device_selector.itemData(index)
-        if data and data.get('type') == 'sink':
-            s = data['data']
-            self.default_sink = s.get('name', '')
-            if self.default_sink:
-                set_default_sink_cmd(self.default_sink)
-                snap = get_audio_snapshot()
-                self._apply_snapshot(snap)
+        # itemData is the row's index into self.sinks / self.sources
+        name = self._picked_name(self.sinks, self.device_selector.itemData(index))
+        if name and name != self.default_sink:
+            self.default_sink = name
+            set_default_sink_cmd(name)
+            self._after_default_change()
 
     def change_source(self, index):
-        data = self.input_selector.itemData(index)
-        if data and data.get('type') == 'source':
-            s = data['data']
-            self.default_source = s.get('name', '')
-            if self.default_source:
-                set_default_source_cmd(self.default_source)
-                snap = get_audio_snapshot()
-                self._apply_snapshot(snap)
+        name = self._picked_name(self.sources, self.input_selector.itemData(index))
+        if name and name != self.default_source:
+            self.default_source = name
+            set_default_source_cmd(name)
+            self._after_default_change()
+
+    @staticmethod
+    def _picked_name(devices, i):
+        return devices[i].get('name', '') if i is not None else ''
+
+    def _after_default_change(self):
+        self._last_snapshot = None   # re-sync the selectors even if the server refused
+        self.request_snapshot()
+        self._boost_polling()
 
     # ------------------ Bluetooth Methods ------------------
     def start_scan(self):
         self.scanningActive = True
         self.scanned_devices.clear()
         self.device_list.clear()
+        self._list_items.clear()
         self.scan_button.setEnabled(False)
-        self.scan_thread = QtCore.QThread()
         self.scan_worker = ScanWorker()
-        self.scan_worker.moveToThread(self.scan_thread)
-        self.scan_worker.devicesFound.connect(self.update_device_list)
-        self.scan_worker.scanFinished.connect(self.scan_finished)
-        self.scan_thread.started.connect(self.scan_worker.start_scan)
-        self.scan_thread.start()
-
-    def update_device_list(self, device):
-        for address, name in device.items():
-            self.scanned_devices[address] = name
-            existing = [self.device_list.item(i).data(qt_user_role()) for i in range(self.device_list.count())]
-            if address not in existing:
-                item = QtWidgets.QListWidgetItem(f"{name} [{address}]")
-                item.setData(qt_user_role(), address)
-                self.device_list.addItem(item)
+        self.scan_worker.signals.devicesFound.connect(self.update_device_list)
+        self.scan_worker.signals.scanFinished.connect(self.scan_finished)
+        QtCore.QThreadPool.globalInstance().start(self.scan_worker)
+
+    def update_device_list(self, devices):
+        self.scanned_devices.update(devices)
+        self.device_list.setUpdatesEnabled(False)
+        self.device_list.blockSignals(True)
+        try:
+            for address, name in devices.items():
+                self._set_list_row(address, name)
+        finally:
+            self.device_list.blockSignals(False)
+            self.device_list.setUpdatesEnabled(True)
 
     def scan_finished(self):
         self.scan_button.setEnabled(True)
-        self.scan_thread.quit()
-        self.scan_thread.wait()
         self.scanningActive = False
 
     def get_paired_bluetooth_devices(self):
-        bus = dbus.SystemBus()
-        mgr = dbus.Interface(bus.get_object('org.bluez', '/'), 'org.freedesktop.DBus.ObjectManager')
-        objects = mgr.GetManagedObjects()
-        devices = {}
-        for path, ifaces in objects.items():
-            if 'org.bluez.Device1' in ifaces:
-                p = ifaces['org.bluez.Device1']
-                address = p.get('Address', '')
-                name = p.get('Name', address)
-                if p.get('Paired', False):
-                    devices[address] = name
-        return devices
+        return BLUEZ_CACHE.paired()
 
     def populate_bluetooth_devices(self):
         if self.scanningActive:
             return
-        merged = {}
-        merged.update(self.scanned_devices)
-        merged.update(self.get_paired_bluetooth_devices())
-        self.device_list.clear()
-        for address, name in merged.items():
-            item = QtWidgets.QListWidgetItem(f"{name} [{address}]")
-            item.setData(qt_user_role(), address)
+        merged = {**self.scanned_devices, **self.get_paired_bluetooth_devices()}
+        gone = self._list_items.keys() - merged.keys()
+        self.device_list.setUpdatesEnabled(False)
+        self.device_list.blockSignals(True)
+        try:
+            # Only touch rows that changed; keeps selection and scroll position
+            for address in gone:
+                self.device_list.takeItem(self.device_list.row(self._list_items.pop(address)))
+            for address, name in merged.items():
+                self._set_list_row(address, name)
+        finally:
+            self.device_list.blockSignals(False)
+            self.device_list.setUpdatesEnabled(True)
+
+    def _set_list_row(self, address, name):
+        """Add the device's row, or retitle it if the name changed."""
+        text = f"{name} [{address}]"
+        item = self._list_items.get(address)
+        if item is None:
+            item = QtWidgets.QListWidgetItem(text)
+            item.setData(USER_ROLE, address)
             self.device_list.addItem(item)
+            self._list_items[address] = item
+        elif item.text() != text:
+            item.setText(text)
 
     def pair_device(self):
         item = self.device_list.currentItem()
         if not item:
             return
-        address = item.data(qt_user_role())
+        address = item.data(USER_ROLE)
         self.pair_button.setEnabled(False)
         self.unpair_button.setEnabled(False)
-        self.pair_thread = QtCore.QThread()
         self.pair_worker = PairWorker(address)
-        self.pair_worker.moveToThread(self.pair_thread)
-        self.pair_worker.pairingResult.connect(self.pairing_finished)
-        self.pair_thread.started.connect(self.pair_worker.pair)
-        self.pair_thread.start()
+        self.pair_worker.signals.pairingResult.connect(self.pairing_finished)
+        QtCore.QThreadPool.globalInstance().start(self.pair_worker)
 
     def pairing_finished(self, success, message):
         self.pair_button.setEnabled(True)
@@ -437,30 +712,24 @@ class VolumeController(QtWidgets.QWidget):
             QTimer.singleShot(3000, self.set_bluetooth_profile)
         else:
             QtWidgets.QMessageBox.warning(self, "Pairing Failed", message)
-        self.pair_thread.quit()
-        self.pair_thread.wait()
 
     def set_bluetooth_profile(self):
-        self.sinks   = get_audio_snapshot()["sinks"]
-        self.sources = get_audio_snapshot()["sources"]
-        pa_address = self.get_recent_bluetooth_address()
+        # The profile logic continues in _set_profile_from_snapshot once pactl answers
+        self.request_snapshot(then=self._set_profile_from_snapshot)
+
+    def _set_profile_from_snapshot(self, snap):
+        pa_address = self.get_recent_bluetooth_address(snap)
         if not pa_address:
             logging.warning("No recent Bluetooth address found.")
             return
-        card = get_card_for_device(pa_address)
-        if not card:
-            QtWidgets.QMessageBox.warning(self, "Bluetooth Device Error", "Failed to find audio card for device.")
-            return
-        set_card_profile(card, 'a2dp_sink')
-        QTimer.singleShot(1500, lambda: self.refresh_after_profile_set(pa_address.replace(":", "_").lower()))
+        self.request_cards(functools.partial(self._switch_to_card, pa_address))
 
-    def get_recent_bluetooth_address(self):
-        snap = get_audio_snapshot()
+    def get_recent_bluetooth_address(self, snap):
         addr = None
         for s in snap["sinks"]:
             nm = s.get("name", "")
             if nm.startswith("bluez_sink."):
-                m = re.match(r'bluez_sink\.([0-9a-f_]{17})', nm)
+                m = _BLUEZ_SINK_RE.match(nm)
                 if m:
                     addr = m.group(1).replace("_", ":")
         if addr:
@@ -468,47 +737,67 @@ class VolumeController(QtWidgets.QWidget):
         for s in snap["sources"]:
             nm = s.get("name", "")
             if nm.startswith("bluez_source."):
-                m = re.match(r'bluez_source\.([0-9a-f_]{17})', nm)
+                m = _BLUEZ_SOURCE_RE.match(nm)
                 if m:
                     return m.group(1).replace("_", ":")
         return None
 
     def connect_and_set_bluetooth_device(self, address, is_sink=True):
-        bus = dbus.SystemBus()
-        mgr = dbus.Interface(bus.get_object('org.bluez', '/'), 'org.freedesktop.DBus.ObjectManager')
-        objects = mgr.GetManagedObjects()
-        device_path = None
-        for path, ifaces in objects.items():
-            if 'org.bluez.Device1' in ifaces:
-                props = ifaces['org.bluez.Device1']
-                if props.get('Address') == address:
-                    device_path = path
-                    break
+        device_path = BLUEZ_CACHE.path_for(address)
         if not device_path:
             QtWidgets.QMessageBox.warning(self, "Bluetooth Device Not Found", f"Device {address} not found on D-Bus")
             return
 
-        device = dbus.Interface(bus.get_object('org.bluez', device_path), 'org.bluez.Device1')
-        props_iface = dbus.Interface(bus.get_object('org.bluez', device_path), 'org.freedesktop.DBus.Properties')
-        try:
-            connected = props_iface.Get('org.bluez.Device1', 'Connected')
-        except dbus.DBusException as e:
-            QtWidgets.QMessageBox.warning(self, "Bluetooth Error", f"Failed to get connection status: {e}")
-            return
-
-        if not connected:
-            try:
-                device.Connect()
-                QTimer.singleShot(3000, lambda a=address: self.set_device_as_default_sink_and_source(a, is_sink=is_sink))
-            except dbus.DBusException as e:
-                QtWidgets.QMessageBox.warning(self, "Bluetooth Connection Failed", f"Failed to connect to {address}: {e}")
+        # 'Connected' is kept current by PropertiesChanged; no Get round-trip needed
+        if not BLUEZ_CACHE.props(device_path).get('Connected', False):
+            device = bluez_interface(device_path, 'org.bluez.Device1')
+            # Async call: the reply (on the D-Bus thread) is forwarded through a queued signal
+            device.Connect(
+                reply_handler=lambda: self.bt_connect_result.emit(address, True, ""),
+                error_handler=lambda e: self.bt_connect_result.emit(address, False, str(e)),
+            )
         else:
             self.set_device_as_default_sink_and_source(address, is_sink=is_sink)
 
-    def set_device_as_default_sink_and_source(self, address, is_sink=True):
-        self.settings.setValue("last_bluetooth", address)
-        pa_address = address.replace(":", "_").lower()
-        card = get_card_for_device(address)
+    def _on_bt_connect_result(self, address, ok, message):
+        if not ok:
+            QtWidgets.QMessageBox.warning(self, "Bluetooth Connection Failed", f"Failed to connect to {address}: {message}")
+            return
+        self._set_default_when_card_ready(address)
+
+    def _set_default_when_card_ready(self, address, tries=20):
+        self.request_cards(functools.partial(self._check_card_ready, address, tries))
+
+    def _check_card_ready(self, address, tries, cards):
+        # BlueZ answers Connect before the sound server has created the card
+        if pa_addr(address) in cards or (tries <= 0 and not self._pactl_live):
+            self._cards_pending.discard(address)
+            self.set_device_as_default_sink_and_source(address, cards=cards)
+        elif self._pactl_live:
+            # The card's 'new' event finishes the job in _on_pactl_event; watchdog in case it never comes
+            self._cards_pending.add(address)
+            QTimer.singleShot(CARD_WAIT_MS, functools.partial(self._card_wait_expired, address))
+        else:
+            QTimer.singleShot(250, functools.partial(self._set_default_when_card_ready, address, tries - 1))
+
+    def _card_wait_expired(self, address):
+        if address in self._cards_pending:
+            self._cards_pending.discard(address)
+            logging.warning(f"No audio card appeared for {address}")
+            self.set_device_as_default_sink_and_source(address)
+
+    def set_device_as_default_sink_and_source(self, address, is_sink=True, cards=None):
+        if address != self._last_bt:
+            self._last_bt = address
+            self.settings.setValue("last_bluetooth", address)
+        if cards is None:
+            self.request_cards(functools.partial(self._switch_to_card, address))
+        else:
+            self._switch_to_card(address, cards)
+
+    def _switch_to_card(self, address, cards):
+        pa_address = pa_addr(address)
+        card = cards.get(pa_address)
         if not card:
             QtWidgets.QMessageBox.warning(self, "Bluetooth Device Error", "Failed to find audio card for the device.")
             return
@@ -516,9 +805,12 @@ class VolumeController(QtWidgets.QWidget):
         QTimer.singleShot(1500, lambda: self.refresh_after_profile_set(pa_address))
 
     def refresh_after_profile_set(self, pa_address):
-        snap = get_audio_snapshot()
-        sink_name = next((s["name"] for s in snap["sinks"] if s["name"].startswith(f"bluez_sink.{pa_address}")), None)
-        src_name  = next((s["name"] for s in snap["sources"] if s["name"].startswith(f"bluez_source.{pa_address}")), None)
+        self.request_snapshot(then=lambda snap: self._set_defaults_after_profile(pa_address))
+
+    def _set_defaults_after_profile(self, pa_address):
+        # The snapshot has just been applied: the bluez name maps are current
+        sink_name = self._bluez_sink_by_addr.get(pa_address)
+        src_name  = self._bluez_source_by_addr.get(pa_address)
 
         if sink_name:
             try:
@@ -531,59 +823,51 @@ class VolumeController(QtWidgets.QWidget):
             except Exception as e:
                 QtWidgets.QMessageBox.warning(self, "PulseAudio Error", f"Failed to set default source: {e}")
 
-        self._apply_snapshot(get_audio_snapshot())
+        self.request_snapshot()
         if sink_name and src_name:
-            QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                              "Bluetooth device set as default input and output.")
+            self.status_bar.showMessage("Bluetooth device set as default input and output.", 3000)
         elif sink_name:
-            QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                              "Bluetooth device set as default output.")
+            self.status_bar.showMessage("Bluetooth device set as default output.", 3000)
         elif src_name:
-            QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                              "Bluetooth device set as default input.")
-        QTimer.singleShot(3000, self.refresh_all_devices)
+            self.status_bar.showMessage("Bluetooth device set as default input.", 3000)
+        self.schedule_refresh(3000)
 
     def unpair_device(self):
         item = self.device_list.currentItem()
         if not item:
             return
-        address = item.data(qt_user_role())
+        address = item.data(USER_ROLE)
         self.pair_button.setEnabled(False)
         self.unpair_button.setEnabled(False)
-        self.unpair_thread = QtCore.QThread()
         self.unpair_worker = UnpairWorker(address)
-        self.unpair_worker.moveToThread(self.unpair_thread)
-        self.unpair_worker.unpairingResult.connect(self.unpairing_finished)
-        self.unpair_thread.started.connect(self.unpair_worker.unpair)
-        self.unpair_thread.start()
+        self.unpair_worker.signals.unpairingResult.connect(self.unpairing_finished)
+        QtCore.QThreadPool.globalInstance().start(self.unpair_worker)
 
     def unpairing_finished(self, success, message):
         self.pair_button.setEnabled(True)
         self.unpair_button.setEnabled(True)
         if success:
+            # The list update comes from BlueZ's InterfacesRemoved for the device
             QtWidgets.QMessageBox.information(self, "Unpairing Result", message)
-            self.bluetooth_devices_updated.emit()
         else:
             QtWidgets.QMessageBox.warning(self, "Unpairing Failed", message)
-        self.unpair_thread.quit()
-        self.unpair_thread.wait()
 
     # -------- Refreshes --------
     def refresh_audio_devices(self):
-        try:
-            snap = get_audio_snapshot()
-            self._apply_snapshot(snap)
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to refresh audio devices: {e}")
+        self.request_snapshot()
 
     def refresh_bluetooth_devices(self):
+        self._bt_update_queued = False
         if not self.scanningActive:
             self.populate_bluetooth_devices()
 
+    def schedule_refresh(self, delay_ms=3000):
+        """Debounced refresh_all_devices; safe to call from the D-Bus thread."""
+        self.refresh_requested.emit(delay_ms)
+
     def refresh_all_devices(self):
         self.refresh_audio_devices()
-        if not self.scanningActive:
-            self.refresh_bluetooth_devices()
+        self.refresh_bluetooth_devices()
 
     # -------- D-Bus listener --------
     @pyqtSlot()
@@ -595,39 +879,108 @@ class VolumeController(QtWidgets.QWidget):
         self.bluetooth_devices_updated.emit()
 
     def start_dbus_signal_listener(self):
-        bus = dbus.SystemBus()
-        bus.add_signal_receiver(
+        om = object_manager()
+        om.connect_to_signal('InterfacesAdded', self._on_iface_added, byte_arrays=True)
+        om.connect_to_signal('InterfacesRemoved', self._on_iface_removed)
+        system_bus().add_signal_receiver(
             self.device_property_changed,
+            bus_name='org.bluez',
             dbus_interface='org.freedesktop.DBus.Properties',
             signal_name='PropertiesChanged',
             arg0='org.bluez.Device1',
-            path_keyword='path'
+            path_keyword='path',
+            byte_arrays=True
+        )
+        # One full walk, answered on the D-Bus thread; signals keep the cache current from here on
+        object_manager().GetManagedObjects(
+            byte_arrays=True,
+            reply_handler=self._on_managed_objects,
+            error_handler=lambda e: logging.error(f"GetManagedObjects failed: {e}"),
         )
 
+    def _on_managed_objects(self, objects):
+        # D-Bus thread
+        BLUEZ_CACHE.load(objects)
+        self.bluez_loaded.emit()
+
+    def _on_bluez_loaded(self):
+        self.populate_bluetooth_devices()
+        last_bt = self._last_bt
+        if last_bt and not self._last_bt_tried:
+            self._last_bt_tried = True
+            self.connect_and_set_bluetooth_device(last_bt)
+
+    # Signal handlers run on the D-Bus main loop thread: only touch the cache here
+    # and reach the UI through (queued) Qt signals.
+    def _queue_bluetooth_update(self):
+        # Skip the emit while one is already waiting in the GUI queue
+        if not self._bt_update_queued:
+            self._bt_update_queued = True
+            self.bluetooth_devices_updated.emit()
+
+    def _on_iface_added(self, path, ifaces):
+        props = BLUEZ_CACHE.add(path, ifaces)
+        if props and props.get('Paired', False):
+            self._queue_bluetooth_update()
+
+    def _on_iface_removed(self, path, interfaces):
+        if BLUEZ_CACHE.remove(path, interfaces):
+            self._queue_bluetooth_update()
+            self.paired_path_removed.emit(str(path))
+
+    def _forget_paired_path(self, path):
+        # GUI thread (queued from _on_iface_removed): drop the path from paired.json
+        stale = [a for a, p in self._paired_paths.items() if p == path]
+        if stale:
+            for a in stale:
+                del self._paired_paths[a]
+            save_paired_paths(self._paired_paths)
+
     def device_property_changed(self, interface, changed, invalidated, path):
+        # arg0 in the match rule already limits this to Device1; RSSI storms stop here
+        if TRACKED_DEVICE_PROPS.isdisjoint(changed) and TRACKED_DEVICE_PROPS.isdisjoint(invalidated):
+            return
+        BLUEZ_CACHE.update(path, changed, invalidated)
+        if 'Paired' in changed:
+            self._queue_bluetooth_update()
         if 'Connected' in changed:
-            QTimer.singleShot(3000, self.refresh_all_devices)
+            self.schedule_refresh(3000)
 
     def set_bluetooth_device_as_default(self, item: QtWidgets.QListWidgetItem):
-        address = item.data(qt_user_role())
+        address = item.data(USER_ROLE)
         self.connect_and_set_bluetooth_device(address)
 
-    # Optional: connect paired devices shortly after launch
+    # Optional: connect paired devices shortly after launch (not called by default;
+    # startup only reconnects last_bluetooth, see _on_bluez_loaded)
     def connect_paired_bluetooth_devices(self):
-        bus = dbus.SystemBus()
-        mgr = dbus.Interface(bus.get_object('org.bluez', '/'), 'org.freedesktop.DBus.ObjectManager')
-        objects = mgr.GetManagedObjects()
-        for path, ifaces in objects.items():
-            if 'org.bluez.Device1' in ifaces:
-                p = ifaces['org.bluez.Device1']
-                address = p.get('Address', '')
-                paired = p.get('Paired', False)
-                connected = p.get('Connected', False)
-                if paired and not connected:
-                    try:
-                        dev = dbus.Interface(bus.get_object('org.bluez', path), 'org.bluez.Device1')
-                        dev.Connect()
-                        QTimer.singleShot(5000, lambda a=address: self.set_device_as_default_sink_and_source(a, is_sink=True))
-                    except dbus.DBusException as e:
-                        logging.error(f"Failed to connect to {address}: {e}")
-        QTimer.singleShot(6000, self.refresh_all_devices)
+        pending = self._autoconnect_pending = set()
+        if BLUEZ_CACHE.loaded:
+            targets = [
+                (p.get('Address', ''), path) for path, p in BLUEZ_CACHE.items()
+                if p.get('Paired', False) and not p.get('Connected', False)
+            ]
+        else:
+            # Before the first enumeration: last session's list; BlueZ rejects stale paths
+            targets = list(self._paired_paths.items())
+        for address, path in targets:
+            # All Connect calls go out at once; replies arrive on the D-Bus thread
+            pending.add(address)
+            dev = bluez_interface(path, 'org.bluez.Device1')
+            dev.Connect(
+                reply_handler=functools.partial(self.autoconnect_result.emit, address, True, ""),
+                error_handler=functools.partial(self._autoconnect_error, address),
+            )
+
+    def _autoconnect_error(self, address, error):
+        # D-Bus thread
+        self.autoconnect_result.emit(address, False, str(error))
+
+    def _on_autoconnect_result(self, address, ok, message):
+        self._autoconnect_pending.discard(address)
+        if ok:
+            self._set_default_when_card_ready(address)
+        else:
+            logging.error(f"Failed to connect to {address}: {message}")
+        # One refresh once every reply (or D-Bus timeout) is in
+        if not self._autoconnect_pending:
+            self.schedule_refresh(0)
@@ -18,7 +18,8 @@ import shutil
 import subprocess
 sys.dont_write_bytecode = True
 
-from .qt_compat import QtCore, QtWidgets, Qt, USING_QT6, qt_align_center
+from .qt_compat import QtCore, QtWidgets, Qt, USING_QT6, ALIGN_CENTER
+from .audio_pactl import pactl_has_json, note_pactl_version, loads_pactl_json
 
 __all__ = ["DefaultPane", "ProfilesPane", "ProfilesWindow"]
 
@@ -26,98 +27,240 @@ __all__ = ["DefaultPane", "ProfilesPane", "ProfilesWindow"]
 
 PACTL_PATH = shutil.which("pactl")
 LAST_PROFILE: dict[str, str] = {}   # remember last non-off profile per card
+# pactl's environment, built once: C locale so the parsers see English keys
+_PACTL_ENV = {**os.environ, "LC_ALL": "C"}
+_PACTL_QENV = QtCore.QProcessEnvironment.systemEnvironment()
+_PACTL_QENV.insert("LC_ALL", "C")
+_PROFILE_RE = re.compile(r"([A-Za-z0-9:_\.\-]+)\s*:\s*(.+)")   # "key: description" under Profiles:
+# One pass per block instead of a startswith chain per line (last match wins, as before)
+_INFO_FIELD_RE = re.compile(r"^(Default Sink|Default Source|Server Name):[ \t]*(.*?)\s*$", re.M)
+_DEVICE_FIELD_RE = re.compile(r"^[ \t]*(Name|Description|Mute):[ \t]*(.*?)\s*$", re.M)
+_CARD_FIELD_RE = re.compile(r"^[ \t]*(Name|Active Profile):[ \t]*(.*?)\s*$", re.M)
+_CARD_DESC_RE = re.compile(r"^[ \t]*device\.(?:description|product\.name)[ \t]*=[ \t]*(.*?)\s*$", re.M)
+_CARD_PROFILES_RE = re.compile(r"^[ \t]*Profiles:[^\n]*\n(.*?)^[ \t]*Active Profile:", re.M | re.S)
+_PACTL_EVENT_RE = re.compile(r"Event '(\w+)' on ([\w-]+) #(\d+)")   # 'pactl subscribe' lines
+
+def _pactl_missing(parent, show_errors):
+    if show_errors and parent:
+        QtWidgets.QMessageBox.critical(
+            parent, "pactl not found",
+            "Could not find 'pactl' in PATH.\nInstall PulseAudio/PipeWire tools or add pactl to PATH."
+        )
+    return 127, "", "pactl not found"
+
+def _pactl_result(args, rc, out, err, parent, show_errors):
+    if show_errors and rc != 0 and parent:
+        QtWidgets.QMessageBox.warning(
+            parent, "Command failed",
+            f"pactl {' '.join(args)}\n\nExit code: {rc}\n{err.strip() or '(no stderr)'}"
+        )
+    return rc, out, err
+
+def _pactl_error(e, parent, show_errors):
+    if show_errors and parent:
+        QtWidgets.QMessageBox.critical(parent, "Error running pactl", str(e))
+    return 1, "", str(e)
 
 def _run_pactl(args, parent: QtWidgets.QWidget | None = None, show_errors: bool = False):
     """
     Run pactl with LC_ALL=C. Returns (rc, stdout, stderr).
     If show_errors and rc!=0, optionally shows a dialog.
     """
-    env = os.environ.copy()
-    env["LC_ALL"] = "C"
     if not PACTL_PATH:
-        if show_errors and parent:
-            QtWidgets.QMessageBox.critical(
-                parent, "pactl not found",
-                "Could not find 'pactl' in PATH.\nInstall PulseAudio/PipeWire tools or add pactl to PATH."
-            )
-        return 127, "", "pactl not found"
+        return _pactl_missing(parent, show_errors)
 
     try:
         p = subprocess.run([PACTL_PATH] + list(args),
                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                           text=True, env=env)
-        if show_errors and p.returncode != 0 and parent:
-            QtWidgets.QMessageBox.warning(
-                parent, "Command failed",
-                f"pactl {' '.join(args)}\n\nExit code: {p.returncode}\n{p.stderr.strip() or '(no stderr)'}"
-            )
-        return p.returncode, p.stdout, p.stderr
+                           text=True, env=_PACTL_ENV)
+        return _pactl_result(args, p.returncode, p.stdout, p.stderr, parent, show_errors)
     except Exception as e:
-        if show_errors and parent:
-            QtWidgets.QMessageBox.critical(parent, "Error running pactl", str(e))
-        return 1, "", str(e)
+        return _pactl_error(e, parent, show_errors)
 
-def _parse_blocks(text: str, header: str):
-    blocks, cur = [], []
-    for raw in text.splitlines():
-        if raw.strip().startswith(header):
-            if cur:
-                blocks.append("\n".join(cur))
-            cur = [raw]
-        else:
-            cur.append(raw)
-    if cur:
-        blocks.append("\n".join(cur))
-    return blocks
+try:
+    _FAILED_TO_START = QtCore.QProcess.ProcessError.FailedToStart  # PyQt6
+except AttributeError:
+    _FAILED_TO_START = QtCore.QProcess.FailedToStart               # PyQt5
 
-# ---- info/defaults ----
-def pactl_info(parent=None):
-    return _run_pactl(["info"], parent=parent, show_errors=True)
-
-def get_defaults(parent=None):
-    rc, info, _ = pactl_info(parent=parent)
-    out = {"sink": "", "source": ""}
-    if rc == 0:
-        for line in info.splitlines():
-            if line.startswith("Default Sink:"):
-                out["sink"] = line.split(":", 1)[1].strip()
-            elif line.startswith("Default Source:"):
-                out["source"] = line.split(":", 1)[1].strip()
+class PactlBatch(QtCore.QObject):
+    """
+    Runs a set of pactl commands side by side on QProcess, so the GUI
+    keeps painting while the server answers. commands() gives the argument
+    lists at each start (JSON or text, see pactl_has_json); finished carries
+    [(rc, stdout), ...] in command order. start() while running queues one rerun.
+    """
+    finished = QtCore.pyqtSignal(list)
+
+    def __init__(self, commands, parent=None):
+        super().__init__(parent)
+        self._commands = commands
+        self._results = []
+        self._pending = 0
+        self._again = False
+
+    def start(self):
+        if self._pending:
+            self._again = True
+            return
+        arg_lists = self._commands()
+        if not PACTL_PATH:
+            self.finished.emit([(127, "")] * len(arg_lists))
+            return
+        self._results = [(1, "")] * len(arg_lists)
+        self._pending = len(arg_lists)
+        for i, args in enumerate(arg_lists):
+            proc = QtCore.QProcess(self)
+            proc.setProcessEnvironment(_PACTL_QENV)
+            proc.finished.connect(lambda *_, i=i, proc=proc: self._done(i, proc, proc.exitCode()))
+            proc.errorOccurred.connect(
+                lambda err, i=i, proc=proc: err == _FAILED_TO_START and self._done(i, proc, 127))
+            proc.start(PACTL_PATH, args)
+
+    def _done(self, i, proc, rc):
+        self._results[i] = (rc, bytes(proc.readAllStandardOutput()).decode("utf-8", "replace"))
+        proc.deleteLater()
+        self._pending -= 1
+        if self._pending:
+            return
+        self.finished.emit(self._results)
+        if self._again:
+            self._again = False
+            self.start()
+
+def _parse_blocks(text: str, header: str):
+    # Slices of text cut in front of each header line: no per-line lists to re-join
+    return [b for b in re.split(rf"(?m)^(?=[ \t]*{re.escape(header)})", text) if b.strip()]
+
+# Top-level "Sink #0" / "Card #3" / "Sink Input #12" headers of a full 'pactl list'
+_LIST_HEADER_RE = re.compile(r"^(?=\S[^\n]* #\d+[ \t]*$)", re.M)
+
+def _list_sections(text: str):
+    """Full 'pactl list' output -> {"Sink": text of all sink blocks, "Card": ..., ...}."""
+    out = {}
+    for block in _LIST_HEADER_RE.split(text):
+        head = block.split(" #", 1)[0]
+        out[head] = out.get(head, "") + block
     return out
 
-# ---- sinks/sources (names, mute) ----
-def list_sinks(parent=None):
-    rc, txt, _ = _run_pactl(["list", "sinks"], parent=parent, show_errors=True)
+# ---- JSON output (pactl >= 16) ----
+def _cmd(*args):
+    return ["-f", "json", *args] if pactl_has_json() else list(args)
+
+def _loads(text: str, default):
+    data = loads_pactl_json(text)
+    return data if isinstance(data, type(default)) else default
+
+def _info_from_json(d: dict):
+    return {
+        "sink": d.get("default_sink_name") or "",
+        "source": d.get("default_source_name") or "",
+        "server": d.get("server_name") or "",
+    }
+
+def _devices_from_json(entries: list):
+    return [
+        {"name": e["name"], "description": e.get("description") or e["name"], "muted": bool(e.get("mute"))}
+        for e in entries if isinstance(e, dict) and e.get("name")
+    ]
+
+def _cards_from_json(entries: list):
+    cards = {}
+    for c in entries:
+        if not isinstance(c, dict) or not c.get("name"):
+            continue
+        profiles = {}
+        for key, p in (c.get("profiles") or {}).items():
+            # Same title as the text listing shows
+            profiles[key] = (
+                f"{p.get('description') or key} (sinks: {p.get('sinks', 0)}, sources: {p.get('sources', 0)}, "
+                f"priority: {p.get('priority', 0)}, available: {'yes' if p.get('available', True) else 'no'})"
+            ) if isinstance(p, dict) else key
+        props = c.get("properties") or {}
+        cards[c["name"]] = {
+            "profiles": profiles,
+            "active": c.get("active_profile") or "",
+            "description": props.get("device.product.name") or props.get("device.description") or "",
+        }
+    return cards
+
+# Command output -> parsed data, whichever format _cmd() asked for when the command
+# started: told apart by the output itself, since the JSON flag can flip meanwhile
+def _is_json(out: str):
+    return out.lstrip()[:1] in ("{", "[")
+
+def _info_out(rc, out):
     if rc != 0:
-        return []
-    out = []
-    for b in _parse_blocks(txt, "Sink #"):
-        name = desc = ""
-        muted = False
-        for raw in b.splitlines():
-            line = raw.strip()
-            if line.startswith("Name:"):          name = line.split(":", 1)[1].strip()
-            elif line.startswith("Description:"):  desc = line.split(":", 1)[1].strip()
-            elif line.startswith("Mute:"):         muted = (line.split(":", 1)[1].strip().lower() == "yes")
-        if name:
-            out.append({"name": name, "description": desc or name, "muted": muted})
-    return out
+        return {"sink": "", "source": "", "server": ""}
+    return _info_from_json(_loads(out, {})) if _is_json(out) else _parse_info(out)
 
-def list_sources(parent=None):
-    rc, txt, _ = _run_pactl(["list", "sources"], parent=parent, show_errors=True)
+def _devices_out(rc, out, header):
     if rc != 0:
         return []
+    return _devices_from_json(_loads(out, [])) if _is_json(out) else _parse_devices(out, header)
+
+def _cards_out(rc, out):
+    if rc != 0:
+        return {}
+    return _cards_from_json(_loads(out, [])) if _is_json(out) else _parse_cards(out)
+
+# ---- info/defaults ----
+def _parse_info(info: str):
+    f = dict(_INFO_FIELD_RE.findall(info))
+    return {
+        "sink": f.get("Default Sink", ""),
+        "source": f.get("Default Source", ""),
+        "server": f.get("Server Name", ""),
+    }
+
+def state_commands():
+    """
+    Everything both panes show, in one round trip: 'info' plus one JSON list per
+    type, or 'info' plus a full text 'list' (cut into sections) without JSON.
+    Until JSON support is known the text pair runs with 'pactl --version' beside it.
+    """
+    if pactl_has_json():
+        return [_cmd("info"), _cmd("list", "sinks"), _cmd("list", "sources"), _cmd("list", "cards")]
+    if pactl_has_json() is None:
+        return [["info"], ["list"], ["--version"]]
+    return [["info"], ["list"]]
+
+def _state_from(results):
+    """state_commands() results -> {"defaults", "server", "sinks", "sources", "cards"}."""
+    if len(results) == 4:
+        info, sinks, sources, cards = results
+        d = _info_out(*info)
+        sinks = _devices_out(*sinks, "Sink #")
+        sources = _devices_out(*sources, "Source #")
+        cards = _cards_out(*cards)
+    else:
+        (rc_i, info), (rc_l, txt), *version = results
+        if version and version[0][0] == 0:
+            note_pactl_version(version[0][1])
+        d = _info_out(rc_i, info)
+        sections = _list_sections(txt) if rc_l == 0 else {}
+        sinks = _parse_devices(sections.get("Sink", ""), "Sink #")
+        sources = _parse_devices(sections.get("Source", ""), "Source #")
+        cards = _parse_cards(sections.get("Card", ""))
+    return {
+        "defaults": {"sink": d["sink"], "source": d["source"]},
+        "server": d["server"],
+        "sinks": sinks,
+        "sources": sources,
+        "cards": cards,
+    }
+
+# ---- sinks/sources (names, mute) ----
+def _parse_devices(txt: str, header: str):
     out = []
-    for b in _parse_blocks(txt, "Source #"):
-        name = desc = ""
-        muted = False
-        for raw in b.splitlines():
-            line = raw.strip()
-            if line.startswith("Name:"):          name = line.split(":", 1)[1].strip()
-            elif line.startswith("Description:"):  desc = line.split(":", 1)[1].strip()
-            elif line.startswith("Mute:"):         muted = (line.split(":", 1)[1].strip().lower() == "yes")
+    for b in _parse_blocks(txt, header):
+        f = dict(_DEVICE_FIELD_RE.findall(b))
+        name = f.get("Name", "")
         if name:
-            out.append({"name": name, "description": desc or name, "muted": muted})
+            out.append({
+                "name": name,
+                "description": f.get("Description") or name,
+                "muted": f.get("Mute", "").lower() == "yes",
+            })
     return out
 
 def set_default_sink(name, parent=None):
@@ -128,14 +271,6 @@ def set_default_source(name, parent=None):
     rc, _, _ = _run_pactl(["set-default-source", name], parent=parent, show_errors=True)
     return rc == 0
 
-def get_sink_mute(name, parent=None):
-    rc, out, _ = _run_pactl(["get-sink-mute", name], parent=parent, show_errors=True)
-    return (rc == 0 and "yes" in out.lower())
-
-def get_source_mute(name, parent=None):
-    rc, out, _ = _run_pactl(["get-source-mute", name], parent=parent, show_errors=True)
-    return (rc == 0 and "yes" in out.lower())
-
 def set_sink_mute(name, mute, parent=None):
     rc, _, _ = _run_pactl(["set-sink-mute", name, "1" if mute else "0"], parent=parent, show_errors=True)
     return rc == 0
@@ -145,60 +280,72 @@ def set_source_mute(name, mute, parent=None):
     return rc == 0
 
 # ---- cards & profiles (power via profile=off) ----
-def list_cards(parent=None):
-    rc, txt, _ = _run_pactl(["list", "cards"], parent=parent, show_errors=True)
-    if rc != 0:
-        return {}
+def _parse_cards(txt: str):
     cards = {}
-    cur = None
-    cur_name = None
-    in_profiles = False
-    for raw in txt.splitlines():
-        line = raw.strip()
-        if line.startswith("Card #"):
-            if cur and cur_name:
-                cards[cur_name] = cur
-            cur = {"profiles": {}, "active": "", "description": ""}
-            cur_name = None
-            in_profiles = False
-        elif line.startswith("Name:"):
-            cur_name = line.split(":", 1)[1].strip()
-        elif line.startswith("Profiles:"):
-            in_profiles = True
-        elif line.startswith("Active Profile:"):
-            cur["active"] = line.split(":", 1)[1].strip().split()[0]
-            in_profiles = False
-        elif in_profiles:
-            m = re.match(r"([A-Za-z0-9:_\.\-]+)\s*:\s*(.+)", line)
-            if m:
-                k, t = m.group(1), m.group(2)
-                cur["profiles"][k] = t
-        elif line.startswith("device.description") or line.startswith("device.product.name"):
-            try:
-                _, v = line.split("=", 1)
-                cur["description"] = v.strip().strip('"')
-            except Exception:
-                pass
-    if cur and cur_name:
-        cards[cur_name] = cur
+    for b in _parse_blocks(txt, "Card #"):
+        f = dict(_CARD_FIELD_RE.findall(b))
+        name = f.get("Name", "")
+        if not name:
+            continue
+        profiles = {}
+        m = _CARD_PROFILES_RE.search(b)
+        if m:
+            for line in m.group(1).splitlines():
+                pm = _PROFILE_RE.match(line.strip())
+                if pm:
+                    profiles[pm.group(1)] = pm.group(2)
+        desc = _CARD_DESC_RE.findall(b)
+        cards[name] = {
+            "profiles": profiles,
+            "active": (f.get("Active Profile", "").split() or [""])[0],
+            "description": desc[-1].strip('"') if desc else "",
+        }
     return cards
 
-def get_card_active(card_name, parent=None):
-    info = list_cards(parent).get(card_name)
-    if not info:
-        return False, ""  # not present (e.g., during BT re-enumeration)
-    return True, info.get("active", "")
-
 def set_card_profile_command(card_name, profile_key, parent=None):
     """Fire-and-forget command; verification is handled asynchronously in UI."""
     rc, _, _ = _run_pactl(["set-card-profile", card_name, profile_key], parent=parent, show_errors=True)
     return rc == 0
 
-def card_supports_off(card_name, parent=None):
-    return "off" in list_cards(parent).get(card_name, {}).get("profiles", {})
-
 # ============================== UI widgets ==============================
 
+def _fill_combo(combo: QtWidgets.QComboBox, items):
+    """
+    Show items [(label, data), ...] in combo. Rows are only rebuilt when the data
+    differs: same rows just get their texts updated, so a refresh that changed
+    nothing structural neither resets the model nor closes an open popup.
+    Returns True if the rows were rebuilt (the caller reselects).
+    """
+    rows = [combo.itemData(i) for i in range(combo.count())]
+    if rows == [data for _, data in items]:
+        for i, (label, _) in enumerate(items):
+            if combo.itemText(i) != label:
+                combo.setItemText(i, label)
+        return False
+    combo.blockSignals(True)
+    combo.clear()
+    for label, data in items:
+        combo.addItem(label, data)
+    combo.blockSignals(False)
+    return True
+
+# Style (simple, warm), shared by both panes
+PANE_STYLESHEET = """
+    QLabel { color:#F0E6DC; }
+    QComboBox, QPushButton {
+        background:#1B120D; color:#F7F0E8;
+        border:1px solid #3B2A22; border-radius:8px; padding:6px 10px; font-weight:600;
+    }
+    QPushButton:hover, QComboBox:hover { border-color:#5A3F31; }
+    QPushButton:pressed { background:#1A120E; border-color:#734E38; }
+"""
+
+# Global style for the window: cocoa bg + ALL TEXT WHITE
+WINDOW_STYLESHEET = """
+    QWidget { background-color:#140E0B; color:#F0E6DC; }
+    QTabBar::tab { color:#F0E6DC; }
+"""
+
 class DefaultPane(QtWidgets.QWidget):
     """
     One tab for *both* Output (sink) and Input (source):
@@ -207,14 +354,20 @@ class DefaultPane(QtWidgets.QWidget):
       - Toggle Mute
     """
     changed = QtCore.pyqtSignal()
+    state_loaded = QtCore.pyqtSignal(dict)   # every state this pane loads itself (cards included)
 
-    def __init__(self):
+    def __init__(self, autoload=True):
         super().__init__()
         self.defaults = {"sink": "", "source": ""}
         self.sinks = []
         self.sources = []
+        self._sinks_by_name = {}
+        self._sources_by_name = {}
+        self._loader = PactlBatch(state_commands, self)
+        self._loader.finished.connect(self._on_loaded)
         self._build()
-        self.refresh()
+        if autoload:
+            self.refresh()
 
     def _build(self):
         layout = QtWidgets.QGridLayout(self)
@@ -254,51 +407,52 @@ class DefaultPane(QtWidgets.QWidget):
 
         # Bottom: refresh button
         self.btn_refresh = QtWidgets.QPushButton("Refresh")
-        self.btn_refresh.clicked.connect(self.refresh)
+        self.btn_refresh.clicked.connect(lambda: self.refresh())
         layout.addWidget(self.btn_refresh, 4, 5)
 
-        # Style (simple, warm)
-        self.setStyleSheet("""
-            QLabel { color:#F0E6DC; }
-            QComboBox, QPushButton {
-                background:#1B120D; color:#F7F0E8;
-                border:1px solid #3B2A22; border-radius:8px; padding:6px 10px; font-weight:600;
-            }
-            QPushButton:hover, QComboBox:hover { border-color:#5A3F31; }
-            QPushButton:pressed { background:#1A120E; border-color:#734E38; }
-        """)
+        self.setStyleSheet(PANE_STYLESHEET)
+
+    def _on_loaded(self, results):
+        state = _state_from(results)
+        self.refresh(state)
+        self.state_loaded.emit(state)
 
     # ---- helpers ----
+    @staticmethod
+    def _label(dev):
+        return f"{dev['description']}  [{dev['name']}]"
+
     def _decorate(self, kind, name, text):
         cur = self.defaults.get(kind, "")
         return f"{text}  (default)" if (name and name == cur) else text
 
-    def refresh(self):
-        self.defaults = get_defaults(parent=self)
-        self.sinks = list_sinks(parent=self)
-        self.sources = list_sources(parent=self)
+    def refresh(self, state=None):
+        """
+        Fill the pane from a _state_from() result (possibly shared with the other pane).
+        Without one, load it asynchronously and come back here when it arrives.
+        """
+        if state is None:
+            self._loader.start()
+            return
+        self.defaults = state["defaults"]
+        self.sinks = state["sinks"]
+        self.sources = state["sources"]
+        self._sinks_by_name = {s["name"]: s for s in self.sinks}
+        self._sources_by_name = {s["name"]: s for s in self.sources}
 
         # Remember current selections
         out_name = self._current(self.out_combo)
         in_name = self._current(self.in_combo)
 
         # Fill outputs
-        self.out_combo.blockSignals(True)
-        self.out_combo.clear()
-        for s in self.sinks:
-            lbl = self._decorate("sink", s["name"], f"{s['description']}  [{s['name']}]")
-            self.out_combo.addItem(lbl, s["name"])
-        self.out_combo.blockSignals(False)
-        self._reselect(self.out_combo, out_name)
+        if _fill_combo(self.out_combo,
+                       [(self._decorate("sink", s["name"], self._label(s)), s["name"]) for s in self.sinks]):
+            self._reselect(self.out_combo, out_name)
 
         # Fill inputs
-        self.in_combo.blockSignals(True)
-        self.in_combo.clear()
-        for s in self.sources:
-            lbl = self._decorate("source", s["name"], f"{s['description']}  [{s['name']}]")
-            self.in_combo.addItem(lbl, s["name"])
-        self.in_combo.blockSignals(False)
-        self._reselect(self.in_combo, in_name)
+        if _fill_combo(self.in_combo,
+                       [(self._decorate("source", s["name"], self._label(s)), s["name"]) for s in self.sources]):
+            self._reselect(self.in_combo, in_name)
 
         # Update statuses + button texts
         self._refresh_status_labels()
@@ -306,7 +460,7 @@ class DefaultPane(QtWidgets.QWidget):
     def _refresh_status_labels(self):
         # Output
         out_name = self._current(self.out_combo)
-        o = next((x for x in self.sinks if x["name"] == out_name), None)
+        o = self._sinks_by_name.get(out_name)
         if o:
             self.out_mute_btn.setText("Unmute Output" if o["muted"] else "Mute Output")
             self.out_status.setText(f"Output muted: {'yes' if o['muted'] else 'no'}")
@@ -315,7 +469,7 @@ class DefaultPane(QtWidgets.QWidget):
             self.out_status.setText("—")
         # Input
         in_name = self._current(self.in_combo)
-        i = next((x for x in self.sources if x["name"] == in_name), None)
+        i = self._sources_by_name.get(in_name)
         if i:
             self.in_mute_btn.setText("Unmute Input" if i["muted"] else "Mute Input")
             self.in_status.setText(f"Input muted: {'yes' if i['muted'] else 'no'}")
@@ -339,49 +493,47 @@ class DefaultPane(QtWidgets.QWidget):
         combo.setCurrentIndex(idx)
 
     # ---- actions ----
+    # Only the clicked row changes: update it in place from the known state instead
+    # of re-reading everything (server-side surprises arrive as 'pactl subscribe' events)
     def _set_default_output(self):
-        name = self._current(self.out_combo)
-        if not name:
-            return
-        ok = set_default_sink(name, parent=self)
-        if not ok:
-            QtWidgets.QMessageBox.information(
-                self, "Default not changed",
-                "The server refused to change the default output (a policy manager may override it)."
-            )
-        QtCore.QTimer.singleShot(350, lambda: (self.refresh(), self.changed.emit()))
+        self._set_default("sink", self.out_combo, self.sinks, set_default_sink, "output")
 
     def _set_default_input(self):
-        name = self._current(self.in_combo)
+        self._set_default("source", self.in_combo, self.sources, set_default_source, "input")
+
+    def _toggle_mute_output(self):
+        self._toggle_mute(self.out_combo, self._sinks_by_name, set_sink_mute, "Output")
+
+    def _toggle_mute_input(self):
+        self._toggle_mute(self.in_combo, self._sources_by_name, set_source_mute, "Input")
+
+    def _set_default(self, kind, combo, items, setter, what):
+        name = self._current(combo)
         if not name:
             return
-        ok = set_default_source(name, parent=self)
-        if not ok:
+        if not setter(name, parent=self):
             QtWidgets.QMessageBox.information(
                 self, "Default not changed",
-                "The server refused to change the default input (a policy manager may override it)."
+                f"The server refused to change the default {what} (a policy manager may override it)."
             )
-        QtCore.QTimer.singleShot(350, lambda: (self.refresh(), self.changed.emit()))
-
-    def _toggle_mute_output(self):
-        name = self._current(self.out_combo)
-        if not name:
             return
-        cur = get_sink_mute(name, parent=self)
-        ok = set_sink_mute(name, not cur, parent=self)
-        if not ok:
-            QtWidgets.QMessageBox.information(self, "Mute toggle failed", "Output device did not change mute state.")
-        QtCore.QTimer.singleShot(300, lambda: (self.refresh(), self.changed.emit()))
+        self.defaults[kind] = name
+        for i, s in enumerate(items):   # combo rows follow the list order
+            combo.setItemText(i, self._decorate(kind, s["name"], self._label(s)))
+        self.changed.emit()
 
-    def _toggle_mute_input(self):
-        name = self._current(self.in_combo)
-        if not name:
+    def _toggle_mute(self, combo, by_name, setter, what):
+        name = self._current(combo)
+        dev = by_name.get(name)
+        if dev is None:
             return
-        cur = get_source_mute(name, parent=self)
-        ok = set_source_mute(name, not cur, parent=self)
-        if not ok:
-            QtWidgets.QMessageBox.information(self, "Mute toggle failed", "Input device did not change mute state.")
-        QtCore.QTimer.singleShot(300, lambda: (self.refresh(), self.changed.emit()))
+        # Toggle what the button shows rather than asking pactl again
+        if not setter(name, not dev["muted"], parent=self):
+            QtWidgets.QMessageBox.information(self, "Mute toggle failed", f"{what} device did not change mute state.")
+            return
+        dev["muted"] = not dev["muted"]
+        self._refresh_status_labels()
+        self.changed.emit()
 
 class ProfilesPane(QtWidgets.QWidget):
     """
@@ -390,11 +542,18 @@ class ProfilesPane(QtWidgets.QWidget):
     """
     changed = QtCore.pyqtSignal()
 
-    def __init__(self):
+    def __init__(self, autoload=True):
         super().__init__()
         self.cards = {}
+        self.events_live = False   # set by ProfilesWindow while 'pactl subscribe' runs
+        self._waiters = []         # profile checks re-run after every refresh
+        self._pinned_card = None   # keep the card being changed selected while it re-enumerates
+        self._shown = None         # (card, active profile) the profile combo was last set to
+        self._loader = PactlBatch(lambda: [_cmd("list", "cards")], self)
+        self._loader.finished.connect(lambda results: self.refresh({"cards": _cards_out(*results[0])}))
         self._build()
-        self.refresh()
+        if autoload:
+            self.refresh()
 
     def _build(self):
         g = QtWidgets.QGridLayout(self)
@@ -419,47 +578,51 @@ class ProfilesPane(QtWidgets.QWidget):
         g.addWidget(self.btn_off_on, 2, 0, 1, 5)
 
         self.status = QtWidgets.QLabel("—")
-        self.status.setAlignment(qt_align_center())
+        self.status.setAlignment(ALIGN_CENTER)
         g.addWidget(self.status, 3, 0, 1, 5)
 
         self.btn_refresh = QtWidgets.QPushButton("Refresh")
-        self.btn_refresh.clicked.connect(self.refresh)
+        self.btn_refresh.clicked.connect(lambda: self.refresh())
         g.addWidget(self.btn_refresh, 4, 4)
 
-        self.setStyleSheet("""
-            QLabel { color:#F0E6DC; }
-            QComboBox, QPushButton {
-                background:#1B120D; color:#F7F0E8;
-                border:1px solid #3B2A22; border-radius:8px; padding:6px 10px; font-weight:600;
-            }
-            QPushButton:hover, QComboBox:hover { border-color:#5A3F31; }
-            QPushButton:pressed { background:#1A120E; border-color:#734E38; }
-        """)
+        self.setStyleSheet(PANE_STYLESHEET)
 
     # ---------- polling helper (non-blocking) ----------
-    def _wait_for_profile(self, card, expected, total_ms=6000, interval_ms=200, on_done=None):
+    def _wait_for_profile(self, card, expected, total_ms=6000, first_ms=50, max_interval_ms=800, on_done=None):
         """
-        Polls list_cards until card's active profile == expected, or timeout.
+        Waits until card's active profile == expected, or timeout.
         Handles BT case where the card disappears temporarily.
+        The check runs from refresh(): after every card event with the event
+        stream, else after async card-list polls backing off from first_ms
+        to max_interval_ms (analog cards answer the first poll, BT ones take seconds).
         """
-        tries = max(1, total_ms // interval_ms)
-
-        def step():
-            nonlocal tries
-            tries -= 1
-            present, active = get_card_active(card, parent=self)
-            if present and active == expected:
-                if on_done:
-                    on_done(True, active)
-                return
-            if tries <= 0:
-                # Don't call this a failure; it's likely still applying on some systems.
-                if on_done:
-                    on_done(False, active)
-                return
-            QtCore.QTimer.singleShot(interval_ms, step)
+        delay = first_ms
+
+        def check():
+            info = self.cards.get(card)
+            if info and info.get("active") == expected:
+                finish(True)
 
-        QtCore.QTimer.singleShot(interval_ms, step)
+        def finish(success):
+            if check not in self._waiters:
+                return
+            self._waiters.remove(check)
+            self._pinned_card = None
+            if on_done:
+                on_done(success, self.cards.get(card, {}).get("active", ""))
+
+        def poll():
+            nonlocal delay
+            if check in self._waiters:
+                self.refresh()
+                delay = min(delay * 2, max_interval_ms)
+                QtCore.QTimer.singleShot(delay, poll)
+
+        self._waiters.append(check)
+        self._pinned_card = card
+        QtCore.QTimer.singleShot(total_ms, lambda: finish(False))
+        if not self.events_live:
+            QtCore.QTimer.singleShot(delay, poll)
 
     def _set_busy(self, busy: bool, applying_text: str | None = None):
         self.card_combo.setEnabled(not busy)
@@ -470,33 +633,40 @@ class ProfilesPane(QtWidgets.QWidget):
             self.status.setText(applying_text)
 
     # ---------- refresh / UI ----------
-    def refresh(self):
-        self.cards = list_cards(parent=self)
-        cur = self._current_card()
-        self.card_combo.blockSignals(True)
-        self.card_combo.clear()
-        for name, info in self.cards.items():
-            desc = info.get("description", "")
-            label = f"{name} — {desc}" if desc else name
-            self.card_combo.addItem(label, name)
-        self.card_combo.blockSignals(False)
-        self._reselect(self.card_combo, cur)
+    def refresh(self, state=None):
+        """Fill from a state holding "cards"; without one, load the cards asynchronously first."""
+        if state is None:
+            self._loader.start()
+            return
+        self.cards = state["cards"]
+        cur = self._pinned_card or self._current_card()
+        items = [(f"{name} — {info['description']}" if info["description"] else name, name)
+                 for name, info in self.cards.items()]
+        if _fill_combo(self.card_combo, items) or (cur and cur != self._current_card()):
+            self.card_combo.blockSignals(True)
+            self._reselect(self.card_combo, cur)
+            self.card_combo.blockSignals(False)
         self._on_card_changed(self.card_combo.currentIndex())
+        for check in list(self._waiters):
+            check()
 
     def _on_card_changed(self, index):
         card = self._current_card()
-        self.profile_combo.clear()
-        if not card or card not in self.cards:
+        info = self.cards.get(card)
+        if info is None:
+            self.profile_combo.clear()
+            self._shown = None
             self.btn_off_on.setText("Turn Off (Profile)")
             self.status.setText("—")
             return
-        info = self.cards[card]
-        profiles = info.get("profiles", {})
-        active = info.get("active", "")
-        for key, title in profiles.items():
-            self.profile_combo.addItem(title, key)
-            if key == active:
-                self.profile_combo.setCurrentIndex(self.profile_combo.count() - 1)
+        profiles = info["profiles"]   # _parse_cards always fills both keys
+        active = info["active"]
+        # Keep a not-yet-applied pick unless the card, its profiles or the active one changed
+        rebuilt = _fill_combo(self.profile_combo, [(title, key) for key, title in profiles.items()])
+        if rebuilt or self._shown != (card, active):
+            self._shown = (card, active)
+            if active in profiles:
+                self.profile_combo.setCurrentIndex(list(profiles).index(active))
         self.btn_off_on.setText("Turn On (Profile)" if active == "off" else "Turn Off (Profile)")
         self.status.setText(f"Active: {active or '—'}  •  Profiles: {len(profiles)}")
 
@@ -519,7 +689,7 @@ class ProfilesPane(QtWidgets.QWidget):
         # Non-blocking verification (prevents false failure on BT)
         self._set_busy(True, applying_text="Applying profile…")
         self._wait_for_profile(
-            card, key, total_ms=6000, interval_ms=200,
+            card, key, total_ms=6000,
             on_done=lambda success, active: self._after_profile_change(card, key, success, active)
         )
 
@@ -544,12 +714,12 @@ class ProfilesPane(QtWidgets.QWidget):
                 return
             self._set_busy(True, applying_text="Turning on…")
             self._wait_for_profile(
-                card, target, total_ms=6000, interval_ms=200,
+                card, target, total_ms=6000,
                 on_done=lambda success, active2: self._after_profile_change(card, target, success, active2)
             )
         else:
-            # turn OFF
-            if not card_supports_off(card, parent=self):
+            # turn OFF (profiles come from the cards already loaded, no new fork)
+            if "off" not in info.get("profiles", {}):
                 QtWidgets.QMessageBox.information(self, "Not supported", "This card does not offer profile 'off'.")
                 return
             if active and active != "off":
@@ -559,14 +729,15 @@ class ProfilesPane(QtWidgets.QWidget):
                 return
             self._set_busy(True, applying_text="Turning off…")
             self._wait_for_profile(
-                card, "off", total_ms=6000, interval_ms=200,
+                card, "off", total_ms=6000,
                 on_done=lambda success, active2: self._after_profile_change(card, "off", success, active2)
             )
 
     def _after_profile_change(self, card, expected, success, active_now):
         # Re-enable UI and refresh; never show a false failure.
         self._set_busy(False)
-        self.refresh()
+        if not success:   # on success the check just ran on fresh cards
+            self.refresh()
         self.changed.emit()
         if not success:
             # Don't claim failure — on some systems it will still switch right after.
@@ -603,22 +774,35 @@ class ProfilesWindow(QtWidgets.QWidget):
         self.setWindowTitle("BluePulse — Defaults & Profiles")
         self.resize(880, 420)
 
-        # Global style for this window: cocoa bg + ALL TEXT WHITE
-        self.setStyleSheet("""
-            QWidget { background-color:#140E0B; color:#F0E6DC; }
-            QTabBar::tab { color:#F0E6DC; }
-        """)
+        self.setStyleSheet(WINDOW_STYLESHEET)
 
         v = QtWidgets.QVBoxLayout(self)
         v.setContentsMargins(14, 14, 14, 14)
         v.setSpacing(12)
 
-        self.default_pane = DefaultPane()
-        self.profiles_pane = ProfilesPane()
+        # Filled by one shared async batch once the window is up
+        self.default_pane = DefaultPane(autoload=False)
+        self.profiles_pane = ProfilesPane(autoload=False)
+        self._loader = PactlBatch(state_commands, self)
+        self._loader.finished.connect(self._apply_state)
+
+        # A state the default pane fetched on its own also carries the cards
+        self.default_pane.state_loaded.connect(self.profiles_pane.refresh)
 
         # Cross-refresh when something changes
-        self.default_pane.changed.connect(self._refresh_all)
-        self.profiles_pane.changed.connect(self._refresh_all)
+        self.default_pane.changed.connect(self._on_pane_changed)
+        self.profiles_pane.changed.connect(self._on_pane_changed)
+
+        # 'pactl subscribe' while shown: server events refresh only the affected pane
+        self._pactl_sub = None
+        self._pactl_buf = b""   # subscribe output after the last complete line
+        self._live = False
+        self._stale = False          # events were missed while hidden
+        self._dirty = set()          # panes waiting for the debounced refresh
+        self._event_timer = QtCore.QTimer(self)
+        self._event_timer.setSingleShot(True)
+        self._event_timer.setInterval(150)
+        self._event_timer.timeout.connect(self._refresh_dirty)
 
         tabs = QtWidgets.QTabWidget()
         tabs.addTab(self.default_pane, "Default")
@@ -641,18 +825,81 @@ class ProfilesWindow(QtWidgets.QWidget):
         self.move(geo.x() + (geo.width() - self.width()) // 2,
                   geo.y() + (geo.height() - self.height()) // 2)
 
-        # Optional: title suffix with server
-        if PACTL_PATH:
-            rc, info, _ = pactl_info(parent=self)
-            if rc == 0:
-                server = ""
-                for line in info.splitlines():
-                    if line.startswith("Server Name:"):
-                        server = line.split(":", 1)[1].strip()
-                        break
-                if server:
-                    self.setWindowTitle(f"BluePulse — Defaults & Profiles — {server}")
+        # First load (and the server name for the title) once the window is on screen
+        QtCore.QTimer.singleShot(0, self._refresh_all)
 
     def _refresh_all(self):
-        self.default_pane.refresh()
-        self.profiles_pane.refresh()
+        self._loader.start()
+
+    def _apply_state(self, results):
+        # One batch feeds both panes (and the title)
+        state = _state_from(results)
+        self.default_pane.refresh(state)
+        self.profiles_pane.refresh(state)
+        if state["server"]:
+            self.setWindowTitle(f"BluePulse — Defaults & Profiles — {state['server']}")
+
+    def _on_pane_changed(self):
+        # The sender already shows its own change; bring the other pane up to date.
+        # With the event stream the server's own events drive the refresh
+        if not self._live:
+            other = self.profiles_pane if self.sender() is self.default_pane else self.default_pane
+            other.refresh()
+
+    # ---- pactl subscribe ----
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self._stale = False
+            self._refresh_all()
+        self._start_subscribe()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._stop_subscribe()
+        self._stale = True
+
+    def _start_subscribe(self):
+        if not PACTL_PATH or self._pactl_sub is not None:
+            return
+        proc = QtCore.QProcess(self)
+        proc.setProcessEnvironment(_PACTL_QENV)   # untranslated "Event '...' on ..." lines
+        proc.readyReadStandardOutput.connect(lambda: self._on_pactl_event(proc))
+        proc.started.connect(lambda: proc is self._pactl_sub and self._set_live(True))
+        proc.finished.connect(lambda *_: proc is self._pactl_sub and self._set_live(False))
+        self._pactl_sub = proc
+        self._pactl_buf = b""
+        proc.start(PACTL_PATH, ["subscribe"])
+
+    def _stop_subscribe(self):
+        proc, self._pactl_sub = self._pactl_sub, None
+        if proc is not None:
+            proc.kill()
+            proc.deleteLater()
+        self._set_live(False)
+
+    def _set_live(self, live):
+        self._live = live
+        self.profiles_pane.events_live = live
+
+    def _on_pactl_event(self, proc):
+        # Whole lines only: an event split across two reads waits for its second half
+        buf = self._pactl_buf + bytes(proc.readAllStandardOutput())
+        head, _, self._pactl_buf = buf.rpartition(b"\n")
+        data = head.decode("utf-8", "replace")
+        for m in _PACTL_EVENT_RE.finditer(data):
+            facility = m.group(2)
+            if facility == "card":
+                self._dirty.add(self.profiles_pane)
+            elif facility in ("sink", "source", "server"):
+                self._dirty.add(self.default_pane)
+        if self._dirty:
+            self._event_timer.start()
+
+    def _refresh_dirty(self):
+        panes, self._dirty = self._dirty, set()
+        if len(panes) > 1:
+            self._refresh_all()
+        else:
+            for pane in panes:
+                pane.refresh()
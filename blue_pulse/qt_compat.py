@@ -36,3 +36,9 @@ def painter_antialiasing_hint():
         return QtGui.QPainter.RenderHint.Antialiasing  # PyQt6
     except AttributeError:
         return QtGui.QPainter.Antialiasing  # PyQt5
+
+# Resolved once at import for per-event callers (mouse moves, paints, item lookups)
+ALIGN_CENTER = qt_align_center()
+USER_ROLE = qt_user_role()
+LEFT_BUTTON = qt_left_button()
+ANTIALIASING = painter_antialiasing_hint()
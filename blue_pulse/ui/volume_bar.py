@@ -1,74 +1,111 @@
 # -*- coding: utf-8 -*-
-from ..qt_compat import QtCore, QtGui, QtWidgets, pyqtSignal, qt_left_button, painter_antialiasing_hint
+from ..qt_compat import QtCore, QtGui, QtWidgets, pyqtSignal, LEFT_BUTTON, ANTIALIASING
 import sys
 sys.dont_write_bytecode = True
 class VolumeBar(QtWidgets.QWidget):
     volumeChanged = pyqtSignal(int)
 
+    BAR_COUNT = 18
+    SPACING = 5
+
+    # Palette, built once for every instance and resize
+    _COL_BG_TOP = QtGui.QColor(34, 23, 18)      # #221712
+    _COL_BG_BOTTOM = QtGui.QColor(20, 14, 11)   # #140e0b
+    _COL_BORDER = QtGui.QColor(56, 40, 32)      # #382820
+    _COL_BAR_TOP = QtGui.QColor(120, 80, 56)    # top glow (#785038)
+    _COL_BAR_MID = QtGui.QColor(70, 44, 30)     # mid (#462c1e)
+    _COL_BAR_BASE = QtGui.QColor(45, 28, 20)    # base (#2d1c14)
+    _COL_RIM = QtGui.QColor(110, 80, 62)        # rim light
+    _COL_OFF = QtGui.QColor(33, 24, 19)         # #211813
+    _COL_OFF_EDGE = QtGui.QColor(52, 34, 23)    # #342217
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._volume = 50
         self.setMinimumHeight(60)
         self.setStyleSheet("background-color: rgba(0,0,0,0);")
+        self._build_brushes()
+
+        # volumeChanged at most once per frame: a drag delivers mouse moves far faster
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(lambda: self.volumeChanged.emit(self._volume))
 
     def setVolume(self, volume):
         v = max(0, min(int(volume), 100))
         if v != self._volume:
+            # Repaint only when the number of lit bars moves (~5 % steps)
+            if v * self.BAR_COUNT // 100 != self._volume * self.BAR_COUNT // 100:
+                self.update()
             self._volume = v
-            self.update()
-            self.volumeChanged.emit(self._volume)
+            if not self._emit_timer.isActive():   # not restarted, so a long drag still emits
+                self._emit_timer.start()
 
     def getVolume(self):
         return self._volume
 
     def mousePressEvent(self, event):
-        if event.button() == qt_left_button():
+        if event.button() == LEFT_BUTTON:
             self._set_from_pos(event.pos())
 
     def mouseMoveEvent(self, event):
-        if event.buttons() & qt_left_button():
+        if event.buttons() & LEFT_BUTTON:
             self._set_from_pos(event.pos())
 
     def _set_from_pos(self, pos: QtCore.QPoint):
-        rect = self.rect()
-        pct = int((pos.x() / max(1, rect.width())) * 100)
-        self.setVolume(pct)
+        self.setVolume(pos.x() * 100 // max(1, self.width()))
 
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(painter_antialiasing_hint())
+    def resizeEvent(self, event):
+        self._build_brushes()
+        super().resizeEvent(event)
 
+    def _build_brushes(self):
+        """Size-dependent paint objects, rebuilt only when the widget is resized."""
         rect = self.rect()
+        self._frame_rect = rect.adjusted(1, 1, -1, -1)
 
         # Base capsule — warm dark cocoa
         bg = QtGui.QLinearGradient(0, 0, 0, rect.height())
-        bg.setColorAt(0.0, QtGui.QColor(34, 23, 18))   # #221712
-        bg.setColorAt(1.0, QtGui.QColor(20, 14, 11))   # #140e0b
-        painter.setBrush(QtGui.QBrush(bg))
-        painter.setPen(QtGui.QPen(QtGui.QColor(56, 40, 32), 1))  # #382820
-        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 12, 12)
+        bg.setColorAt(0.0, self._COL_BG_TOP)
+        bg.setColorAt(1.0, self._COL_BG_BOTTOM)
+        self._bg_brush = QtGui.QBrush(bg)
+        self._pen_border = QtGui.QPen(self._COL_BORDER, 1)
 
         # Bars
-        bar_count = 18
-        spacing = 5
         inner = rect.adjusted(12, 10, -12, -10)
-        bar_w = (inner.width() - spacing * (bar_count - 1)) / bar_count
-        active = int((self._volume / 100) * bar_count)
-
-        for i in range(bar_count):
-            x = int(inner.x() + i * (bar_w + spacing))
-            r = QtCore.QRect(int(x), inner.y(), int(bar_w), inner.height())
-
-            if i < active:
-                # shiny walnut gradient
-                g = QtGui.QLinearGradient(0, r.y(), 0, r.bottom())
-                g.setColorAt(0.0, QtGui.QColor(120, 80, 56))  # top glow (#785038)
-                g.setColorAt(0.5, QtGui.QColor(70, 44, 30))   # mid (#462c1e)
-                g.setColorAt(1.0, QtGui.QColor(45, 28, 20))   # base (#2d1c14)
-                painter.setBrush(QtGui.QBrush(g))
-                painter.setPen(QtGui.QPen(QtGui.QColor(110, 80, 62), 1))  # rim light
-            else:
-                painter.setBrush(QtGui.QColor(33, 24, 19))                # #211813
-                painter.setPen(QtGui.QPen(QtGui.QColor(52, 34, 23), 1))   # #342217
+        span = inner.width() - self.SPACING * (self.BAR_COUNT - 1)
+        bar_w = span // self.BAR_COUNT
+        self._bar_rects = [
+            QtCore.QRect(inner.x() + i * span // self.BAR_COUNT + i * self.SPACING, inner.y(), bar_w, inner.height())
+            for i in range(self.BAR_COUNT)
+        ]
 
+        # shiny walnut gradient (all bars share the same vertical span)
+        g = QtGui.QLinearGradient(0, inner.y(), 0, inner.bottom())
+        g.setColorAt(0.0, self._COL_BAR_TOP)
+        g.setColorAt(0.5, self._COL_BAR_MID)
+        g.setColorAt(1.0, self._COL_BAR_BASE)
+        self._bar_brush_active = QtGui.QBrush(g)
+        self._pen_rim = QtGui.QPen(self._COL_RIM, 1)
+        self._bar_brush_inactive = QtGui.QBrush(self._COL_OFF)
+        self._pen_off = QtGui.QPen(self._COL_OFF_EDGE, 1)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(ANTIALIASING)
+
+        painter.setBrush(self._bg_brush)
+        painter.setPen(self._pen_border)
+        painter.drawRoundedRect(self._frame_rect, 12, 12)
+
+        # Two runs: lit bars, then the rest (one brush/pen switch per paint)
+        active = self._volume * self.BAR_COUNT // 100
+        painter.setBrush(self._bar_brush_active)
+        painter.setPen(self._pen_rim)
+        for r in self._bar_rects[:active]:
+            painter.drawRoundedRect(r, 6, 6)
+        painter.setBrush(self._bar_brush_inactive)
+        painter.setPen(self._pen_off)
+        for r in self._bar_rects[active:]:
             painter.drawRoundedRect(r, 6, 6)
@@ -1,126 +1,266 @@
 # -*- coding: utf-8 -*-
 from .qt_compat import QtCore, pyqtSignal, pyqtSlot
 import dbus, sys
+import logging
+import threading
+import time
+from .audio_pactl import get_audio_snapshot, read_bluez_cards
+from .bluez import (
+    BLUEZ_CACHE, DEVICE_IFACE, ADAPTER_IFACE, PROPS_IFACE, OM_IFACE,
+    managed_objects, bluez_interface, system_bus, dbus_error_name,
+)
 sys.dont_write_bytecode = True
-class ScanWorker(QtCore.QObject):
-    devicesFound = pyqtSignal(dict)
-    scanFinished = pyqtSignal()
+
+DEFAULT_ADAPTER = '/org/bluez/hci0'   # the only adapter on nearly every machine
+CACHE_WAIT_S = 5   # for the controller's startup walk before walking ourselves
+
+def _ensure_cache():
+    # Filled by the controller's async GetManagedObjects on the D-Bus loop thread.
+    # A worker started before its reply waits for it instead of sending a second
+    # walk from this thread; only if it never comes does the worker fetch.
+    if not BLUEZ_CACHE.wait_loaded(CACHE_WAIT_S):
+        BLUEZ_CACHE.load(managed_objects())
+
+# Adapters a scan has discovery running on, so quitting mid-scan can still stop it
+_discovering = set()
+_discovering_lock = threading.Lock()
+
+def stop_discovery():
+    """StopDiscovery on every adapter a scan left running; called on the way out."""
+    with _discovering_lock:
+        paths = list(_discovering)
+        _discovering.clear()
+    for path in paths:
+        try:
+            bluez_interface(path, ADAPTER_IFACE).StopDiscovery(timeout=2)
+        except dbus.DBusException:
+            pass
+
+class SnapshotWorker(QtCore.QObject):
+    """Runs get_audio_snapshot() (and bluez card lookups) off the GUI thread; lives on a long-running QThread."""
+    snapshotReady = pyqtSignal(dict)
+    snapshotFailed = pyqtSignal(str)
+    cardsReady = pyqtSignal(dict)
 
     @pyqtSlot()
-    def start_scan(self):
-        bus = dbus.SystemBus()
-        mgr = dbus.Interface(bus.get_object('org.bluez', '/'), 'org.freedesktop.DBus.ObjectManager')
-        objects = mgr.GetManagedObjects()
-
-        adapter_path = None
-        for path, ifaces in objects.items():
-            if 'org.bluez.Adapter1' in ifaces:
-                adapter_path = path
-                break
-        if adapter_path is None:
-            self.scanFinished.emit()
+    def run(self):
+        try:
+            snap = get_audio_snapshot()
+        except Exception as e:
+            self.snapshotFailed.emit(str(e))
             return
+        self.snapshotReady.emit(snap)
 
-        adapter = dbus.Interface(bus.get_object('org.bluez', adapter_path), 'org.bluez.Adapter1')
+    @pyqtSlot()
+    def read_cards(self):
         try:
-            adapter.StartDiscovery()
-        except dbus.DBusException:
-            self.scanFinished.emit()
+            cards = read_bluez_cards()
+        except Exception:
+            cards = {}
+        self.cardsReady.emit(cards)
+
+class WorkerSignals(QtCore.QObject):
+    """QRunnable is not a QObject; the pooled workers emit through one of these."""
+    devicesFound = pyqtSignal(dict)
+    scanFinished = pyqtSignal()
+    pairingResult = pyqtSignal(bool, str)
+    unpairingResult = pyqtSignal(bool, str)
+
+class ScanWorker(QtCore.QRunnable):
+    """
+    Discovery for SCAN_MS. Devices BlueZ already knows are reported up front;
+    new ones arrive through InterfacesAdded while discovery runs, and names that
+    BlueZ resolves later through Device1 PropertiesChanged.
+    cancel() ends the discovery window early.
+    Discovered devices are batched and emitted at most once per FLUSH_MS.
+    """
+    SCAN_MS = 10000
+    FLUSH_MS = 500
+
+    def __init__(self):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._stop = threading.Event()
+        self._found = {}
+        self._paths = {}             # device path -> address, for late Name/Alias updates
+        self._found_lock = threading.Lock()
+
+    def cancel(self):
+        self._stop.set()
+
+    def run(self):
+        bus = system_bus()
+        matches = [
+            bus.add_signal_receiver(
+                self._on_interfaces_added,
+                bus_name='org.bluez',
+                dbus_interface=OM_IFACE,
+                signal_name='InterfacesAdded',
+                path='/',
+                byte_arrays=True
+            ),
+            bus.add_signal_receiver(
+                self._on_properties_changed,
+                bus_name='org.bluez',
+                dbus_interface=PROPS_IFACE,
+                signal_name='PropertiesChanged',
+                arg0=DEVICE_IFACE,
+                path_keyword='path',
+                byte_arrays=True
+            ),
+        ]
+        adapter_path = self._start_discovery()
+        if adapter_path is None:
+            for m in matches:
+                m.remove()
+            self.signals.scanFinished.emit()
             return
 
-        QtCore.QThread.sleep(10)  # brief discovery period
+        # Already-known devices come from the signal-maintained cache
+        _ensure_cache()
+        known = BLUEZ_CACHE.names()
+        if known:
+            self.signals.devicesFound.emit(known)
+        # New devices are collected by _on_interfaces_added meanwhile
+        deadline = time.monotonic() + self.SCAN_MS / 1000
+        while not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._stop.wait(min(self.FLUSH_MS / 1000, remaining))
+            self._flush_found()
+
+        for m in matches:
+            m.remove()
+        with _discovering_lock:
+            still_ours = adapter_path in _discovering   # else stop_discovery() got there first
+        if still_ours:
+            # Bounded wait; the adapter stays registered for stop_discovery() until BlueZ has answered
+            try:
+                bluez_interface(adapter_path, ADAPTER_IFACE).StopDiscovery(timeout=2)
+            except dbus.DBusException:
+                pass
+            with _discovering_lock:
+                _discovering.discard(adapter_path)
+        self._flush_found()
+        self.signals.scanFinished.emit()
+
+    def _start_discovery(self):
+        """Path of the adapter with discovery running, or None. Before the BlueZ walk has landed
+        hci0 is tried directly; the walk is only waited for if that fails."""
+        if not BLUEZ_CACHE.loaded:
+            adapter_path = self._try_start(DEFAULT_ADAPTER)
+            if adapter_path is not None:
+                return adapter_path
+            _ensure_cache()
+        adapter_path = BLUEZ_CACHE.adapter_path
+        return self._try_start(adapter_path) if adapter_path else None
 
+    @staticmethod
+    def _try_start(adapter_path):
         try:
-            adapter.StopDiscovery()
+            bluez_interface(adapter_path, ADAPTER_IFACE).StartDiscovery()
         except dbus.DBusException:
-            pass
+            return None
+        with _discovering_lock:
+            _discovering.add(adapter_path)
+        return adapter_path
 
-        objects = mgr.GetManagedObjects()
-        for path, ifaces in objects.items():
-            if 'org.bluez.Device1' in ifaces:
-                p = ifaces['org.bluez.Device1']
-                address = p.get('Address', '')
-                name = p.get('Name', address)
-                self.devicesFound.emit({address: name})
+    def _on_interfaces_added(self, path, ifaces):
+        # D-Bus main loop thread: collect only, run() emits in batches
+        p = ifaces.get(DEVICE_IFACE)
+        if p is not None:
+            address = p.get('Address', '')
+            with self._found_lock:
+                self._paths[path] = address
+                self._found[address] = p.get('Name', address)
 
-        self.scanFinished.emit()
+    def _on_properties_changed(self, interface, changed, invalidated, path):
+        # D-Bus main loop thread: a name resolved after the device appeared
+        name = changed.get('Name') or changed.get('Alias')
+        if not name:
+            return
+        with self._found_lock:
+            address = self._paths.get(path)
+        if address is None:
+            address = BLUEZ_CACHE.props(path).get('Address')
+        if address:
+            with self._found_lock:
+                self._found[address] = name
 
-class PairWorker(QtCore.QObject):
-    pairingResult = pyqtSignal(bool, str)
+    def _flush_found(self):
+        with self._found_lock:
+            found, self._found = self._found, {}
+        if found:
+            self.signals.devicesFound.emit(found)
 
+class PairWorker(QtCore.QRunnable):
     def __init__(self, device_address):
         super().__init__()
+        self.signals = WorkerSignals()
         self.device_address = device_address
 
-    @pyqtSlot()
-    def pair(self):
-        bus = dbus.SystemBus()
-        mgr = dbus.Interface(bus.get_object('org.bluez', '/'), 'org.freedesktop.DBus.ObjectManager')
-        objects = mgr.GetManagedObjects()
-
-        device_path = None
-        for path, ifaces in objects.items():
-            if 'org.bluez.Device1' in ifaces:
-                p = ifaces['org.bluez.Device1']
-                if p.get('Address') == self.device_address:
-                    device_path = path
-                    break
+    def run(self):
+        _ensure_cache()
+        device_path = BLUEZ_CACHE.path_for(self.device_address)
         if not device_path:
-            self.pairingResult.emit(False, "Device not found")
+            self.signals.pairingResult.emit(False, "Device not found")
             return
 
-        device = dbus.Interface(bus.get_object('org.bluez', device_path), 'org.bluez.Device1')
-        props = dbus.Interface(bus.get_object('org.bluez', device_path), 'org.freedesktop.DBus.Properties')
-        try:
-            props.Set('org.bluez.Device1', 'Trusted', True)
-        except dbus.DBusException:
-            pass
+        device = bluez_interface(device_path, DEVICE_IFACE)
 
-        try:
-            device.Pair()
-            QtCore.QThread.sleep(2)
-            device.Connect()
-            self.pairingResult.emit(True, "Pairing and connection successful")
-        except dbus.DBusException as e:
-            if getattr(e, "get_dbus_name", lambda: "")() == 'org.bluez.Error.AlreadyExists':
-                try:
-                    device.Connect()
-                    self.pairingResult.emit(True, "Device already paired and connected")
-                except dbus.DBusException as conn_e:
-                    self.pairingResult.emit(False, f"Already paired, but failed to connect: {conn_e}")
+        # Async chain on the D-Bus loop thread: Pair -> Connect, no blind sleep in between
+        def on_connected(msg):
+            return lambda: self.signals.pairingResult.emit(True, msg)
+
+        def on_connect_error(prefix):
+            return lambda e: self.signals.pairingResult.emit(False, f"{prefix}{e}")
+
+        def on_paired():
+            device.Connect(reply_handler=on_connected("Pairing and connection successful"),
+                           error_handler=on_connect_error(""))
+
+        def on_pair_error(e):
+            if dbus_error_name(e) == 'org.bluez.Error.AlreadyExists':
+                device.Connect(reply_handler=on_connected("Device already paired and connected"),
+                               error_handler=on_connect_error("Already paired, but failed to connect: "))
             else:
-                self.pairingResult.emit(False, str(e))
+                self.signals.pairingResult.emit(False, str(e))
 
-class UnpairWorker(QtCore.QObject):
-    unpairingResult = pyqtSignal(bool, str)
+        def pair(*_):
+            device.Pair(reply_handler=on_paired, error_handler=on_pair_error, timeout=60)
 
+        if BLUEZ_CACHE.props(device_path).get('Trusted', False):
+            pair()
+        else:
+            # Trust first; pairing goes ahead from the reply even if the write failed
+            def on_trust_error(e):
+                logging.error(f"Setting Trusted on {device_path} failed: {e}")
+                pair()
+
+            props = bluez_interface(device_path, PROPS_IFACE)
+            props.Set(DEVICE_IFACE, 'Trusted', dbus.Boolean(True, variant_level=1),
+                      reply_handler=pair, error_handler=on_trust_error)
+
+class UnpairWorker(QtCore.QRunnable):
     def __init__(self, device_address):
         super().__init__()
+        self.signals = WorkerSignals()
         self.device_address = device_address
 
-    @pyqtSlot()
-    def unpair(self):
-        bus = dbus.SystemBus()
-        mgr = dbus.Interface(bus.get_object('org.bluez', '/'), 'org.freedesktop.DBus.ObjectManager')
-        objects = mgr.GetManagedObjects()
-
-        adapter_path = None
-        device_path = None
-        for path, ifaces in objects.items():
-            if 'org.bluez.Adapter1' in ifaces:
-                adapter_path = path
-            if 'org.bluez.Device1' in ifaces:
-                p = ifaces['org.bluez.Device1']
-                if p.get('Address') == self.device_address:
-                    device_path = path
-                    break
-        if not device_path or not adapter_path:
-            self.unpairingResult.emit(False, "Device not found")
+    def run(self):
+        _ensure_cache()
+        device_path = BLUEZ_CACHE.path_for(self.device_address)
+        if not device_path:
+            self.signals.unpairingResult.emit(False, "Device not found")
             return
+        # The device's own adapter: /org/bluez/hci1/dev_XX -> /org/bluez/hci1
+        adapter_path = device_path.rsplit('/', 1)[0]
 
-        adapter = dbus.Interface(bus.get_object('org.bluez', adapter_path), 'org.bluez.Adapter1')
-        try:
-            adapter.RemoveDevice(device_path)
-            self.unpairingResult.emit(True, "Unpairing successful")
-        except dbus.DBusException as e:
-            self.unpairingResult.emit(False, str(e))
+        adapter = bluez_interface(adapter_path, ADAPTER_IFACE)
+        # The result is reported from the D-Bus loop thread; the pool thread is free at once
+        adapter.RemoveDevice(
+            dbus.ObjectPath(device_path),
+            reply_handler=lambda: self.signals.unpairingResult.emit(True, "Unpairing successful"),
+            error_handler=lambda e: self.signals.unpairingResult.emit(False, str(e)),
+        )